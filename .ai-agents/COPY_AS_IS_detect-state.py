@@ -10,37 +10,56 @@
 Falls back to local file if OpenMemory is not available.
 
 Usage: python .ai-agents/detect-state.py
+       (set AI_AGENTS_VERBOSE=1 to also list recent development history)
 
 Returns:
 - "INITIALIZE" if starting fresh
 - "RESUME" with current state if resuming
 """
 
-import json
 import os
+import sys
 from pathlib import Path
 
-# Try to import OpenMemory client
+# Prefer orjson's C parser for large state files when it is installed
 try:
-    from openmemory_client import OpenMemoryClient
-    OPENMEMORY_AVAILABLE = True
+    from orjson import loads as json_loads
 except ImportError:
-    OPENMEMORY_AVAILABLE = False
+    from json import loads as json_loads
+
+HEAVY_RULE = "=" * 70 + "\n"
+RULE = "-" * 70 + "\n"
 
 def detect_state():
     """Detect current project state and provide guidance."""
+    # Collect the whole report and write it once rather than per line
+    out = []
+    try:
+        return _detect_state(out)
+    finally:
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+
+def _detect_state(out):
+    """Build the report into `out` and return the detected mode."""
 
     project_root = Path(__file__).parent.parent
     project_name = project_root.name
     state_file = project_root / ".ai-agents" / "project-state.json"
 
-    print("=" * 70)
-    print("AI AGENT INITIALIZATION DETECTOR (OpenMemory-Enabled)")
-    print("=" * 70)
-    print()
+    out.append(HEAVY_RULE)
+    out.append("AI AGENT INITIALIZATION DETECTOR (OpenMemory-Enabled)\n")
+    out.append(HEAVY_RULE)
+    out.append("\n")
+
+    # Try OpenMemory first if available. Imported here rather than at module
+    # level: the client pulls in requests, which importing this file shouldn't pay for
+    try:
+        from openmemory_client import OpenMemoryClient
+    except ImportError:
+        OpenMemoryClient = None
 
-    # Try OpenMemory first if available
-    if OPENMEMORY_AVAILABLE:
+    if OpenMemoryClient is not None:
         try:
             client = OpenMemoryClient(
                 base_url=os.environ.get("OPENMEMORY_URL", "http://localhost:8080"),
@@ -50,112 +69,114 @@ def detect_state():
             # Check if OpenMemory is running
             health = client.health_check()
             if health.get("ok"):
-                print(f"✓ Connected to OpenMemory (v{health.get('version', 'unknown')})")
-                print()
+                out.append(f"✓ Connected to OpenMemory (v{health.get('version', 'unknown')})\n")
+                out.append("\n")
 
                 # Try to load state from OpenMemory
                 state = client.load_project_state()
 
                 if state:
                     # RESUME mode from OpenMemory
-                    print("✓ STATUS: RESUME MODE (OpenMemory)")
-                    print()
-                    print("Project state loaded from OpenMemory's long-term memory.")
-                    print()
-
-                    print("CURRENT PROJECT STATE:")
-                    print("-" * 70)
-                    print(f"  Phase: {state['project_metadata']['current_phase']}")
-                    print(f"  Progress: {state['project_metadata']['progress_percentage']}%")
-                    print(f"  Last Updated: {state['project_metadata']['last_updated']}")
-                    print(f"  Active Agent: {state['project_metadata']['active_agent']}")
-                    print()
-
-                    print("NEXT RECOMMENDED TASKS:")
-                    print("-" * 70)
+                    out.append("✓ STATUS: RESUME MODE (OpenMemory)\n")
+                    out.append("\n")
+                    out.append("Project state loaded from OpenMemory's long-term memory.\n")
+                    out.append("\n")
+
+                    out.append("CURRENT PROJECT STATE:\n")
+                    out.append(RULE)
+                    out.append(f"  Phase: {state['project_metadata']['current_phase']}\n")
+                    out.append(f"  Progress: {state['project_metadata']['progress_percentage']}%\n")
+                    out.append(f"  Last Updated: {state['project_metadata']['last_updated']}\n")
+                    out.append(f"  Active Agent: {state['project_metadata']['active_agent']}\n")
+                    out.append("\n")
+
+                    out.append("NEXT RECOMMENDED TASKS:\n")
+                    out.append(RULE)
                     for i, task in enumerate(state.get('next_recommended_tasks', [])[:3], 1):
-                        print(f"  {i}. {task['task']}")
-                        print(f"     Agent: {task['agent']}")
-                        print(f"     Priority: {task['priority']}")
-                        print()
-
-                    print("DEVELOPMENT HISTORY (Recent Actions):")
-                    print("-" * 70)
-                    history = client.get_history(limit=5)
-                    for entry in history[:5]:
-                        print(f"  • {entry.get('content', 'N/A')[:100]}")
-                    print()
-
-                    print("ACTION FOR AI AGENT:")
-                    print("-" * 70)
-                    print("  1. Use OpenMemory client to retrieve full context")
-                    print("  2. Continue with next_recommended_tasks")
-                    print("  3. Record all actions in OpenMemory")
-                    print("  4. Update state as you complete tasks")
-                    print()
+                        out.append(f"  {i}. {task['task']}\n")
+                        out.append(f"     Agent: {task['agent']}\n")
+                        out.append(f"     Priority: {task['priority']}\n")
+                        out.append("\n")
+
+                    # History costs an extra round trip; only fetch it on request
+                    if os.environ.get("AI_AGENTS_VERBOSE"):
+                        out.append("DEVELOPMENT HISTORY (Recent Actions):\n")
+                        out.append(RULE)
+                        history = client.get_history(limit=5)
+                        for entry in history[:5]:
+                            out.append(f"  • {entry.get('content', 'N/A')[:100]}\n")
+                        out.append("\n")
+
+                    out.append("ACTION FOR AI AGENT:\n")
+                    out.append(RULE)
+                    out.append("  1. Use OpenMemory client to retrieve full context\n")
+                    out.append("  2. Continue with next_recommended_tasks\n")
+                    out.append("  3. Record all actions in OpenMemory\n")
+                    out.append("  4. Update state as you complete tasks\n")
+                    out.append("\n")
 
                     return "RESUME"
                 else:
                     # INITIALIZE mode - no state in OpenMemory
-                    print("✓ STATUS: INITIALIZE MODE (OpenMemory)")
-                    print()
-                    print("No project state found in OpenMemory.")
-                    print("This is a fresh start.")
-                    print()
-
-                    print("ACTION FOR AI AGENT:")
-                    print("-" * 70)
-                    print("  1. Read README.md for architecture overview")
-                    print("  2. Read .ai-agents/README.md for system documentation")
-                    print("  3. Begin Phase 1: Foundation & Infrastructure")
-                    print("  4. Use OpenMemory client to store all state and actions")
-                    print()
-
-                    print("FIRST STEPS:")
-                    print("-" * 70)
-                    print("  1. Create project directory structure")
-                    print("  2. Initialize project state in OpenMemory")
-                    print("  3. Begin implementing foundation components")
-                    print("  4. Record all decisions and patterns in OpenMemory")
-                    print()
+                    out.append("✓ STATUS: INITIALIZE MODE (OpenMemory)\n")
+                    out.append("\n")
+                    out.append("No project state found in OpenMemory.\n")
+                    out.append("This is a fresh start.\n")
+                    out.append("\n")
+
+                    out.append("ACTION FOR AI AGENT:\n")
+                    out.append(RULE)
+                    out.append("  1. Read README.md for architecture overview\n")
+                    out.append("  2. Read .ai-agents/README.md for system documentation\n")
+                    out.append("  3. Begin Phase 1: Foundation & Infrastructure\n")
+                    out.append("  4. Use OpenMemory client to store all state and actions\n")
+                    out.append("\n")
+
+                    out.append("FIRST STEPS:\n")
+                    out.append(RULE)
+                    out.append("  1. Create project directory structure\n")
+                    out.append("  2. Initialize project state in OpenMemory\n")
+                    out.append("  3. Begin implementing foundation components\n")
+                    out.append("  4. Record all decisions and patterns in OpenMemory\n")
+                    out.append("\n")
 
                     return "INITIALIZE"
         except Exception as e:
-            print(f"⚠ OpenMemory not available: {e}")
-            print("Falling back to local file system...")
-            print()
+            out.append(f"⚠ OpenMemory not available: {e}\n")
+            out.append("Falling back to local file system...\n")
+            out.append("\n")
     else:
-        print("⚠ OpenMemory client not found (openmemory_client.py)")
-        print("Using local file system for state management")
-        print()
+        out.append("⚠ OpenMemory client not found (openmemory_client.py)\n")
+        out.append("Using local file system for state management\n")
+        out.append("\n")
 
     # Fallback to local file system
     if state_file.exists():
         # RESUME mode
-        print("✓ STATUS: RESUME MODE")
-        print()
-        print("The .ai-agents/project-state.json file exists.")
-        print("This means development was previously started.")
-        print()
+        out.append("✓ STATUS: RESUME MODE\n")
+        out.append("\n")
+        out.append("The .ai-agents/project-state.json file exists.\n")
+        out.append("This means development was previously started.\n")
+        out.append("\n")
 
         try:
-            with open(state_file, 'r') as f:
-                state = json.load(f)
-
-            print("CURRENT PROJECT STATE:")
-            print("-" * 70)
-            print(f"  Phase: {state['project_metadata']['current_phase']}")
-            print(f"  Last Updated: {state['project_metadata']['last_updated']}")
-            print(f"  Active Agent: {state['project_metadata']['active_agent']}")
-            print()
-
-            print("NEXT RECOMMENDED TASKS:")
-            print("-" * 70)
+            with open(state_file, 'rb') as f:
+                state = json_loads(f.read())
+
+            out.append("CURRENT PROJECT STATE:\n")
+            out.append(RULE)
+            out.append(f"  Phase: {state['project_metadata']['current_phase']}\n")
+            out.append(f"  Last Updated: {state['project_metadata']['last_updated']}\n")
+            out.append(f"  Active Agent: {state['project_metadata']['active_agent']}\n")
+            out.append("\n")
+
+            out.append("NEXT RECOMMENDED TASKS:\n")
+            out.append(RULE)
             for i, task in enumerate(state.get('next_recommended_tasks', [])[:3], 1):
-                print(f"  {i}. {task['task']}")
-                print(f"     Agent: {task['agent']}")
-                print(f"     Priority: {task['priority']}")
-                print()
+                out.append(f"  {i}. {task['task']}\n")
+                out.append(f"     Agent: {task['agent']}\n")
+                out.append(f"     Priority: {task['priority']}\n")
+                out.append("\n")
 
             # Count completed vs total services
             completed = 0
@@ -176,54 +197,54 @@ def detect_state():
             total = completed + in_progress + not_started
             if total > 0:
                 completion = (completed / total) * 100
-                print("PROGRESS SUMMARY:")
-                print("-" * 70)
-                print(f"  Completed: {completed}/{total} services ({completion:.1f}%)")
-                print(f"  In Progress: {in_progress} services")
-                print(f"  Not Started: {not_started} services")
-                print()
-
-            print("ACTION FOR AI AGENT:")
-            print("-" * 70)
-            print("  1. Read .ai-agents/project-state.json for full context")
-            print("  2. Continue with next_recommended_tasks")
-            print("  3. Update state as you complete tasks")
-            print()
+                out.append("PROGRESS SUMMARY:\n")
+                out.append(RULE)
+                out.append(f"  Completed: {completed}/{total} services ({completion:.1f}%)\n")
+                out.append(f"  In Progress: {in_progress} services\n")
+                out.append(f"  Not Started: {not_started} services\n")
+                out.append("\n")
+
+            out.append("ACTION FOR AI AGENT:\n")
+            out.append(RULE)
+            out.append("  1. Read .ai-agents/project-state.json for full context\n")
+            out.append("  2. Continue with next_recommended_tasks\n")
+            out.append("  3. Update state as you complete tasks\n")
+            out.append("\n")
 
             return "RESUME"
 
         except Exception as e:
-            print(f"⚠ Warning: Could not read state file: {e}")
-            print("You may need to manually inspect .ai-agents/project-state.json")
+            out.append(f"⚠ Warning: Could not read state file: {e}\n")
+            out.append("You may need to manually inspect .ai-agents/project-state.json\n")
             return "RESUME"
 
     else:
         # INITIALIZE mode
-        print("✓ STATUS: INITIALIZE MODE")
-        print()
-        print("The .ai-agents/project-state.json file does NOT exist.")
-        print("This is a fresh start.")
-        print()
-
-        print("ACTION FOR AI AGENT:")
-        print("-" * 70)
-        print("  1. Read README.md for architecture overview")
-        print("  2. Read .ai-agents/README.md for system documentation")
-        print("  3. Begin Phase 1: Foundation & Infrastructure")
-        print("  4. The system will guide you through initialization")
-        print()
-
-        print("FIRST STEPS:")
-        print("-" * 70)
-        print("  1. Create project directory structure")
-        print("  2. Implement shared libraries (libs/)")
-        print("  3. Build infrastructure services (service_registry, event_bus)")
-        print("  4. Update project-state.json as you progress")
-        print()
+        out.append("✓ STATUS: INITIALIZE MODE\n")
+        out.append("\n")
+        out.append("The .ai-agents/project-state.json file does NOT exist.\n")
+        out.append("This is a fresh start.\n")
+        out.append("\n")
+
+        out.append("ACTION FOR AI AGENT:\n")
+        out.append(RULE)
+        out.append("  1. Read README.md for architecture overview\n")
+        out.append("  2. Read .ai-agents/README.md for system documentation\n")
+        out.append("  3. Begin Phase 1: Foundation & Infrastructure\n")
+        out.append("  4. The system will guide you through initialization\n")
+        out.append("\n")
+
+        out.append("FIRST STEPS:\n")
+        out.append(RULE)
+        out.append("  1. Create project directory structure\n")
+        out.append("  2. Implement shared libraries (libs/)\n")
+        out.append("  3. Build infrastructure services (service_registry, event_bus)\n")
+        out.append("  4. Update project-state.json as you progress\n")
+        out.append("\n")
 
         return "INITIALIZE"
 
-    print("=" * 70)
+    out.append(HEAVY_RULE)
 
 if __name__ == "__main__":
     mode = detect_state()
@@ -6,10 +6,21 @@
 """
 
 import ast
-import astor
+import hashlib
+import io
+import json
+import multiprocessing
 import os
+import re
+import shutil
+import sys
+import time
+import tokenize
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 
 class InstrumentOptions:
     def __init__(
@@ -34,11 +45,52 @@ def __init__(
 class FunctionWrapper(ast.NodeTransformer):
     """AST transformer that wraps functions with tracing code"""
 
+    # Shared, read-only prototype nodes. The same instances are referenced
+    # from every wrapped function instead of being rebuilt per function.
+    _TRACER_LOAD = ast.Name(id='__tracer', ctx=ast.Load())
+    _ENTER_ATTR = ast.Attribute(value=_TRACER_LOAD, attr='enter', ctx=ast.Load())
+    _EXIT_ATTR = ast.Attribute(value=_TRACER_LOAD, attr='exit', ctx=ast.Load())
+    _START_ATTR = ast.Attribute(value=_TRACER_LOAD, attr='start_function', ctx=ast.Load())
+    _END_ATTR = ast.Attribute(value=_TRACER_LOAD, attr='end_function', ctx=ast.Load())
+    _ERROR_ATTR = ast.Attribute(value=_TRACER_LOAD, attr='error_function', ctx=ast.Load())
+    _EXCEPTION_NAME = ast.Name(id='Exception', ctx=ast.Load())
+    _CTX_STORE = ast.Name(id='__ctx', ctx=ast.Store())
+    _CTX_LOAD = ast.Name(id='__ctx', ctx=ast.Load())
+    _ERROR_LOAD = ast.Name(id='error', ctx=ast.Load())
+    # except Exception as error:
+    #     __tracer.error_function(__ctx, error)
+    #     raise error
+    _ERROR_HANDLER = ast.ExceptHandler(
+        type=_EXCEPTION_NAME,
+        name='error',
+        body=[
+            ast.Expr(
+                value=ast.Call(func=_ERROR_ATTR, args=[_CTX_LOAD, _ERROR_LOAD], keywords=[])
+            ),
+            ast.Raise(exc=_ERROR_LOAD)
+        ]
+    )
+    # from .ai_agents.logging.runtime.tracer import __tracer
+    _TRACER_IMPORT = ast.ImportFrom(
+        module='ai_agents.logging.runtime.tracer',
+        names=[ast.alias(name='__tracer', asname=None)],
+        level=1
+    )
+
     def __init__(self, file_path: str, options: InstrumentOptions):
         self.file_path = file_path
         self.options = options
         self.functions_wrapped = 0
-        self.exclude_functions = self._get_excluded_functions()
+        self.exclude_functions = frozenset(self._get_excluded_functions())
+        self.functions_allowed = frozenset(options.functions) if options.functions else None
+        self._exclude_prefixes = tuple(
+            prefix.strip()
+            for prefix in os.getenv('TRACING_EXCLUDE_FUNCTION_PREFIXES', '').split(',')
+            if prefix.strip()
+        )
+        self._file_path_const = ast.Constant(value=file_path)
+        self._in_wrapped_body = False
+        self._visitors: Dict[type, Any] = {}
 
     def _get_excluded_functions(self) -> List[str]:
         """Get list of functions to exclude from instrumentation"""
@@ -61,21 +113,50 @@ def _should_instrument(self, func_name: str) -> bool:
             return False
 
         # If specific functions specified, only instrument those
-        if self.options.functions:
-            return func_name in self.options.functions
+        if self.functions_allowed is not None:
+            return func_name in self.functions_allowed
+
+        # Check prefixes (startswith takes the whole tuple at once)
+        return not (self._exclude_prefixes and func_name.startswith(self._exclude_prefixes))
+
+    def visit(self, node: ast.AST) -> Any:
+        """Dispatch to visit_<Class>, resolving each node class only once"""
+        # NodeVisitor.visit builds the method name and getattr()s it for
+        # every node; caching the bound method per class skips both
+        visitor = self._visitors.get(node.__class__)
+        if visitor is None:
+            visitor = getattr(self, 'visit_' + node.__class__.__name__, self.generic_visit)
+            self._visitors[node.__class__] = visitor
+        return visitor(node)
+
+    def visit_Module(self, node: ast.Module) -> ast.Module:
+        """Transform the module and add the tracer import"""
+        self.generic_visit(node)
+
+        # The import goes after the docstring and any __future__ imports,
+        # both of which must stay first
+        index = 0
+        if (node.body and isinstance(node.body[0], ast.Expr)
+                and isinstance(node.body[0].value, ast.Constant)
+                and isinstance(node.body[0].value.value, str)):
+            index = 1
+        while (index < len(node.body) and isinstance(node.body[index], ast.ImportFrom)
+               and node.body[index].module == '__future__'):
+            index += 1
+        node.body.insert(index, self._TRACER_IMPORT)
 
-        # Check prefixes
-        env_prefixes = os.getenv('TRACING_EXCLUDE_FUNCTION_PREFIXES', '')
-        if env_prefixes:
-            for prefix in env_prefixes.split(','):
-                if func_name.startswith(prefix.strip()):
-                    return False
+        return node
 
-        return True
+    def visit_ClassDef(self, node: ast.ClassDef) -> ast.ClassDef:
+        """Descend into classes, except those nested in a wrapped function"""
+        if self._in_wrapped_body:
+            return node
+        return self.generic_visit(node)
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.FunctionDef:
         """Transform function definitions"""
-        if not self._should_instrument(node.name):
+        # Nested defs keep their own returns; __ctx belongs to the outer function
+        if self._in_wrapped_body or not self._should_instrument(node.name):
             return node
 
         self.functions_wrapped += 1
@@ -91,7 +172,7 @@ def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.FunctionDef:
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AsyncFunctionDef:
         """Transform async function definitions"""
-        if not self._should_instrument(node.name):
+        if self._in_wrapped_body or not self._should_instrument(node.name):
             return node
 
         self.functions_wrapped += 1
@@ -103,18 +184,13 @@ def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AsyncFunctio
 
     def _wrap_minimal(self, node: ast.FunctionDef) -> ast.FunctionDef:
         """Level 1: Minimal - just entry/exit"""
+        name_const = ast.Constant(value=node.name)
+
         # __tracer.enter('function_name', 'file.py')
         enter_call = ast.Expr(
             value=ast.Call(
-                func=ast.Attribute(
-                    value=ast.Name(id='__tracer', ctx=ast.Load()),
-                    attr='enter',
-                    ctx=ast.Load()
-                ),
-                args=[
-                    ast.Constant(value=node.name),
-                    ast.Constant(value=self.file_path)
-                ],
+                func=self._ENTER_ATTR,
+                args=[name_const, self._file_path_const],
                 keywords=[]
             )
         )
@@ -122,12 +198,8 @@ def _wrap_minimal(self, node: ast.FunctionDef) -> ast.FunctionDef:
         # __tracer.exit('function_name')
         exit_call = ast.Expr(
             value=ast.Call(
-                func=ast.Attribute(
-                    value=ast.Name(id='__tracer', ctx=ast.Load()),
-                    attr='exit',
-                    ctx=ast.Load()
-                ),
-                args=[ast.Constant(value=node.name)],
+                func=self._EXIT_ATTR,
+                args=[name_const],
                 keywords=[]
             )
         )
@@ -145,18 +217,10 @@ def _wrap_standard(self, node: ast.FunctionDef) -> ast.FunctionDef:
 
         # __ctx = __tracer.start_function('name', 'file.py', params)
         start_call = ast.Assign(
-            targets=[ast.Name(id='__ctx', ctx=ast.Store())],
+            targets=[self._CTX_STORE],
             value=ast.Call(
-                func=ast.Attribute(
-                    value=ast.Name(id='__tracer', ctx=ast.Load()),
-                    attr='start_function',
-                    ctx=ast.Load()
-                ),
-                args=[
-                    ast.Constant(value=node.name),
-                    ast.Constant(value=self.file_path),
-                    params_dict
-                ],
+                func=self._START_ATTR,
+                args=[ast.Constant(value=node.name), self._file_path_const, params_dict],
                 keywords=[]
             )
         )
@@ -164,34 +228,9 @@ def _wrap_standard(self, node: ast.FunctionDef) -> ast.FunctionDef:
         # Wrap body in try-except
         try_body = self._transform_returns(node.body)
 
-        # except Exception as error:
-        #     __tracer.error_function(__ctx, error)
-        #     raise
-        except_handler = ast.ExceptHandler(
-            type=ast.Name(id='Exception', ctx=ast.Load()),
-            name='error',
-            body=[
-                ast.Expr(
-                    value=ast.Call(
-                        func=ast.Attribute(
-                            value=ast.Name(id='__tracer', ctx=ast.Load()),
-                            attr='error_function',
-                            ctx=ast.Load()
-                        ),
-                        args=[
-                            ast.Name(id='__ctx', ctx=ast.Load()),
-                            ast.Name(id='error', ctx=ast.Load())
-                        ],
-                        keywords=[]
-                    )
-                ),
-                ast.Raise(exc=ast.Name(id='error', ctx=ast.Load()))
-            ]
-        )
-
         try_except = ast.Try(
             body=try_body,
-            handlers=[except_handler],
+            handlers=[self._ERROR_HANDLER],
             orelse=[],
             finalbody=[]
         )
@@ -211,49 +250,19 @@ def _wrap_async(self, node: ast.AsyncFunctionDef) -> ast.AsyncFunctionDef:
         params_dict = self._create_params_dict(node.args)
 
         start_call = ast.Assign(
-            targets=[ast.Name(id='__ctx', ctx=ast.Store())],
+            targets=[self._CTX_STORE],
             value=ast.Call(
-                func=ast.Attribute(
-                    value=ast.Name(id='__tracer', ctx=ast.Load()),
-                    attr='start_function',
-                    ctx=ast.Load()
-                ),
-                args=[
-                    ast.Constant(value=node.name),
-                    ast.Constant(value=self.file_path),
-                    params_dict
-                ],
+                func=self._START_ATTR,
+                args=[ast.Constant(value=node.name), self._file_path_const, params_dict],
                 keywords=[]
             )
         )
 
         try_body = self._transform_returns(node.body)
 
-        except_handler = ast.ExceptHandler(
-            type=ast.Name(id='Exception', ctx=ast.Load()),
-            name='error',
-            body=[
-                ast.Expr(
-                    value=ast.Call(
-                        func=ast.Attribute(
-                            value=ast.Name(id='__tracer', ctx=ast.Load()),
-                            attr='error_function',
-                            ctx=ast.Load()
-                        ),
-                        args=[
-                            ast.Name(id='__ctx', ctx=ast.Load()),
-                            ast.Name(id='error', ctx=ast.Load())
-                        ],
-                        keywords=[]
-                    )
-                ),
-                ast.Raise(exc=ast.Name(id='error', ctx=ast.Load()))
-            ]
-        )
-
         try_except = ast.Try(
             body=try_body,
-            handlers=[except_handler],
+            handlers=[self._ERROR_HANDLER],
             orelse=[],
             finalbody=[]
         )
@@ -264,63 +273,158 @@ def _wrap_async(self, node: ast.AsyncFunctionDef) -> ast.AsyncFunctionDef:
 
     def _create_params_dict(self, args: ast.arguments) -> ast.Dict:
         """Create dictionary of function parameters"""
-        keys = []
-        values = []
+        # A dict display rather than dict(a=a, **kwargs): the call form raises
+        # when **kwargs repeats a positional-only name, and `dict` may be shadowed
+        named = args.posonlyargs + args.args
+        if args.vararg:
+            named = named + [args.vararg]
+        named = named + args.kwonlyargs
+
+        keys = [ast.Constant(value=arg.arg) for arg in named]
+        values = [ast.Name(id=arg.arg, ctx=ast.Load()) for arg in named]
 
-        # Regular arguments
-        for arg in args.args:
-            keys.append(ast.Constant(value=arg.arg))
-            values.append(ast.Name(id=arg.arg, ctx=ast.Load()))
+        # {..., **kwargs} (a None key is a ** unpack)
+        if args.kwarg:
+            keys.append(None)
+            values.append(ast.Name(id=args.kwarg.arg, ctx=ast.Load()))
 
         return ast.Dict(keys=keys, values=values)
 
     def _transform_returns(self, body: List[ast.stmt]) -> List[ast.stmt]:
         """Transform return statements to call tracer"""
-        transformer = ReturnTransformer()
-        return [transformer.visit(stmt) for stmt in body]
-
-
-class ReturnTransformer(ast.NodeTransformer):
-    """Transformer that wraps return statements"""
+        # Same visitor, flagged so visit_Return rewrites and nested defs are left alone
+        self._in_wrapped_body = True
+        try:
+            return [self.visit(stmt) for stmt in body]
+        finally:
+            self._in_wrapped_body = False
 
     def visit_Return(self, node: ast.Return) -> ast.Return:
         """Transform return statement to call __tracer.end_function"""
-        if node.value:
+        if self._in_wrapped_body and node.value:
             # return __tracer.end_function(__ctx, value)
             node.value = ast.Call(
-                func=ast.Attribute(
-                    value=ast.Name(id='__tracer', ctx=ast.Load()),
-                    attr='end_function',
-                    ctx=ast.Load()
-                ),
-                args=[
-                    ast.Name(id='__ctx', ctx=ast.Load()),
-                    node.value
-                ],
+                func=self._END_ATTR,
+                args=[self._CTX_LOAD, node.value],
                 keywords=[]
             )
         return node
 
 
+# Fields that hold nested statements (ExceptHandler / match_case expose
+# their own `body`, so they are expanded on the next step)
+_STATEMENT_BODIES = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+# Marker for instrumented code, and the whole line (plus newline) around it.
+# Byte patterns so sources never need decoding just to be checked.
+_TRACER_RE = re.compile(rb'__tracer|from \.ai_agents\.logging\.runtime\.tracer')
+_TRACER_LINE_RE = re.compile(rb'(?m)^.*(?:' + _TRACER_RE.pattern + rb').*\n?')
+
+_ADAPTER_MTIME_NS = os.stat(__file__).st_mtime_ns
+
+# A line starting a (possibly async) def; defs are compound statements, so
+# they always begin a logical line
+_DEF_RE = re.compile(rb'(?m)^[ \t\f]*(?:async[ \t\f]+)?def[ \t\f]')
+
+# Below this many files instrument_files stays in-process
+_MIN_PARALLEL_FILES = 4
+
+
+# Parsed modules are large; keep only a working set of them in memory
+_PARSE_CACHE_SIZE = 128
+
+# On-disk transforms not reused for this long are deleted
+_CACHE_MAX_AGE = 7 * 24 * 3600
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_cached(path: str, mtime_ns: int, size: int) -> ast.Module:
+    """Parse a file once per (mtime, size); callers must not mutate the tree"""
+    return ast.parse(Path(path).read_bytes(), filename=path)
+
+
+def _options_key(options: InstrumentOptions) -> str:
+    """Stable fingerprint of everything that affects instrumented output"""
+    # repr() rather than hash(): str hashes are salted per process, which
+    # would make the on-disk cache miss on every run. The adapter's own
+    # mtime invalidates entries written by an older transformer.
+    return repr((
+        _ADAPTER_MTIME_NS,
+        options.level,
+        options.capture_params,
+        options.capture_return,
+        options.capture_vars,
+        options.capture_async,
+        tuple(options.functions),
+        tuple(options.exclude_functions),
+        os.getenv('TRACING_EXCLUDE_FUNCTIONS', ''),
+        os.getenv('TRACING_EXCLUDE_FUNCTION_PREFIXES', ''),
+    ))
+
+
 class PythonInstrumenter:
     """Main instrumenter class for Python files"""
 
+    # Drop every in-memory parsed AST (the on-disk output cache is unaffected)
+    clear_cache = staticmethod(_parse_cached.cache_clear)
+
     def __init__(self):
-        self.backup_dir = Path.cwd() / '.ai-agents' / 'logging' / 'backups' / 'original'
+        self._cwd = Path.cwd()
+        self.backup_dir = self._cwd / '.ai-agents' / 'logging' / 'backups' / 'original'
         self.backup_dir.mkdir(parents=True, exist_ok=True)
+        # Backups are stored by content hash, so identical sources share one
+        # copy and re-backing-up an unchanged file is a no-op
+        self._blob_dir = self.backup_dir.parent / 'by-hash'
+        self._created_dirs = {self.backup_dir}
+        self._cache_dir = self._cwd / '.ai-agents' / 'logging' / 'cache'
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._prune_cache()
+        # Kept beside (not inside) the backup tree so it can't shadow a
+        # backed-up manifest.json from the project root
+        self._manifest_path = self.backup_dir.parent / 'manifest.json'
+        self._manifest = self._load_manifest()
+        self._persist_manifest = True
 
     def instrument_file(self, file_path: str, options: InstrumentOptions) -> Dict[str, Any]:
         """Instrument a Python file"""
         try:
-            # Read original file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                original_code = f.read()
+            # Level 0 wraps nothing, so there is nothing to read or rewrite
+            if options.level == 0:
+                return self._skipped_result()
+
+            # A file left untouched since we last instrumented it is either
+            # done already (same options) or redone from its backup
+            backup_path = self._check_manifest(file_path)
+            if backup_path is not None and self._manifest_options(file_path) == _options_key(options):
+                return {
+                    'success': True,
+                    'unchanged': True,
+                    'functions_wrapped': self._manifest[os.path.abspath(file_path)]['functions_wrapped'],
+                    'backup_path': backup_path
+                }
+
+            # Read original file once as bytes; the same bytes feed the
+            # backup, the instrumented check and the parser
+            current_bytes = Path(file_path).read_bytes()
+            if backup_path is not None:
+                original_bytes = backup_path.read_bytes()
+            else:
+                original_bytes = current_bytes
+
+            # No def statement anywhere means no function to wrap; skip the parse
+            if _DEF_RE.search(original_bytes) is None:
+                return self._skipped_result()
+
+            # Decode with the file's declared encoding before anything is
+            # written, so an undecodable file fails without side effects
+            encoding, _ = tokenize.detect_encoding(io.BytesIO(original_bytes).readline)
+            original_code = original_bytes.decode(encoding)
 
             # Create backup
-            backup_path = self._create_backup(file_path, original_code)
+            backup_path = self._create_backup(original_bytes)
 
             # Check if already instrumented
-            if self._is_instrumented(original_code):
+            if self._is_instrumented(original_bytes):
                 return {
                     'success': False,
                     'error': 'File is already instrumented. Use uninstrument first.',
@@ -328,32 +432,49 @@ def instrument_file(self, file_path: str, options: InstrumentOptions) -> Dict[st
                     'backup_path': backup_path
                 }
 
-            # Parse to AST
-            tree = ast.parse(original_code, filename=file_path)
+            # Reuse a previous transform of this exact file + options
+            cache_path = self._cache_path(file_path, options)
+            cached = self._load_cached(cache_path)
+
+            if cached is not None:
+                instrumented_code = cached['src']
+                functions_wrapped = cached['functions_wrapped']
+            else:
+                # Parse to AST (bytes, so PEP 263 coding cookies are honoured)
+                tree = ast.parse(original_bytes, filename=file_path)
+
+                # Transform AST
+                transformer = FunctionWrapper(file_path, options)
+                new_tree = transformer.visit(tree)
+
+                # Fix missing locations
+                ast.fix_missing_locations(new_tree)
 
-            # Transform AST
-            transformer = FunctionWrapper(file_path, options)
-            new_tree = transformer.visit(tree)
+                # Generate code (ast.unparse is native on 3.9+; astor only for older)
+                if sys.version_info >= (3, 9):
+                    instrumented_code = ast.unparse(new_tree)
+                else:
+                    import astor
+                    instrumented_code = astor.to_source(new_tree)
 
-            # Fix missing locations
-            ast.fix_missing_locations(new_tree)
+                functions_wrapped = transformer.functions_wrapped
 
-            # Generate code
-            instrumented_code = astor.to_source(new_tree)
+                self._store_cached(cache_path, instrumented_code, functions_wrapped)
 
-            # Add tracer import
-            instrumented_code = self._add_tracer_import(instrumented_code)
+            # Write instrumented code (left untouched if byte-identical)
+            written = self._write_if_changed(file_path, instrumented_code.encode('utf-8'), current_bytes)
 
-            # Write instrumented code
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(instrumented_code)
+            self._remember(file_path, options, instrumented_code, functions_wrapped, backup_path)
+            if self._persist_manifest:
+                self._save_manifest()
 
             return {
                 'success': True,
                 'original_code': original_code,
                 'instrumented_code': instrumented_code,
-                'functions_wrapped': transformer.functions_wrapped,
-                'backup_path': backup_path
+                'functions_wrapped': functions_wrapped,
+                'backup_path': backup_path,
+                'unchanged': not written
             }
 
         except Exception as e:
@@ -364,25 +485,49 @@ def instrument_file(self, file_path: str, options: InstrumentOptions) -> Dict[st
                 'backup_path': ''
             }
 
+    def _skipped_result(self) -> Dict[str, Any]:
+        """Result for a file that needs no instrumentation"""
+        return {
+            'success': True,
+            'skipped': True,
+            'functions_wrapped': 0,
+            'backup_path': ''
+        }
+
+    def instrument_files(self, file_paths: List[str], options: InstrumentOptions) -> List[Dict[str, Any]]:
+        """Instrument several files, fanning out across processes"""
+        # Pool start-up costs more than a handful of files takes serially
+        if len(file_paths) < _MIN_PARALLEL_FILES or not _pool_usable():
+            return [self.instrument_file(path, options) for path in file_paths]
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker) as executor:
+            results = list(executor.map(_instrument_one, file_paths, [options] * len(file_paths)))
+
+        # Workers don't write the manifest themselves; merge it here once
+        for path, result in zip(file_paths, results):
+            if result['success'] and 'instrumented_code' in result:
+                self._remember(path, options, result['instrumented_code'],
+                               result['functions_wrapped'], result['backup_path'])
+        self._save_manifest()
+
+        return results
+
     def uninstrument_file(self, file_path: str, restore: bool = True) -> bool:
         """Remove instrumentation from a file"""
         try:
             if restore:
                 # Restore from backup
-                backup_path = self._get_backup_path(file_path)
+                backup_path = self._find_backup(file_path)
                 if backup_path.exists():
-                    with open(backup_path, 'r', encoding='utf-8') as f:
-                        original_code = f.read()
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(original_code)
+                    self._write_if_changed(file_path, backup_path.read_bytes(),
+                                           Path(file_path).read_bytes())
+                    self._forget(file_path)
                     return True
             else:
                 # Remove instrumentation
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    code = f.read()
-                cleaned = self._remove_instrumentation(code)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(cleaned)
+                code = Path(file_path).read_bytes()
+                self._write_if_changed(file_path, self._remove_instrumentation(code), code)
+                self._forget(file_path)
                 return True
             return False
         except Exception as e:
@@ -392,15 +537,19 @@ def uninstrument_file(self, file_path: str, restore: bool = True) -> bool:
     def get_functions_in_file(self, file_path: str) -> List[str]:
         """Get list of functions in a file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                code = f.read()
-
-            tree = ast.parse(code, filename=file_path)
+            st = os.stat(file_path)
+            tree = _parse_cached(file_path, st.st_mtime_ns, st.st_size)
             functions = []
 
-            for node in ast.walk(tree):
+            # Defs can only appear as statements, so walk statement bodies
+            # breadth-first and never descend into expressions
+            todo = deque(tree.body)
+            while todo:
+                node = todo.popleft()
                 if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                     functions.append(node.name)
+                for field in _STATEMENT_BODIES:
+                    todo.extend(getattr(node, field, ()))
 
             return functions
 
@@ -408,42 +557,205 @@ def get_functions_in_file(self, file_path: str) -> List[str]:
             print(f'[Instrumenter] Failed to get functions: {e}')
             return []
 
-    def _add_tracer_import(self, code: str) -> str:
-        """Add tracer import to code"""
-        import_statement = 'from .ai_agents.logging.runtime.tracer import __tracer\n\n'
-        return import_statement + code
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Load the record of files instrumented by previous runs"""
+        try:
+            with open(self._manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self) -> None:
+        """Atomically persist the manifest"""
+        tmp_path = self._manifest_path.with_name(self._manifest_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._manifest, f)
+        os.replace(tmp_path, self._manifest_path)
+
+    def _check_manifest(self, file_path: str) -> Optional[Path]:
+        """Return the backup of a file unchanged since we instrumented it"""
+        entry = self._manifest.get(os.path.abspath(file_path))
+        if entry is None:
+            return None
+
+        st = os.stat(file_path)
+        if entry['mtime'] != st.st_mtime_ns or entry['size'] != st.st_size:
+            return None
+
+        backup_path = self._find_backup(file_path)
+        if not backup_path.exists():
+            return None
+
+        return backup_path
+
+    def _manifest_options(self, file_path: str) -> Optional[str]:
+        """Options fingerprint a file was last instrumented with"""
+        # Entries from before options were recorded never match
+        return self._manifest.get(os.path.abspath(file_path), {}).get('options')
+
+    def _remember(self, file_path: str, options: InstrumentOptions, instrumented_code: str,
+                  functions_wrapped: int, backup_path: Path) -> None:
+        """Record the instrumented file's on-disk state in the manifest"""
+        st = os.stat(file_path)
+        self._manifest[os.path.abspath(file_path)] = {
+            'mtime': st.st_mtime_ns,
+            'size': st.st_size,
+            'options': _options_key(options),
+            'sha1': hashlib.sha1(instrumented_code.encode('utf-8')).hexdigest(),
+            'functions_wrapped': functions_wrapped,
+            'backup': str(backup_path)
+        }
+
+    def _forget(self, file_path: str) -> None:
+        """Drop a file from the manifest once it is no longer instrumented"""
+        if self._manifest.pop(os.path.abspath(file_path), None) is not None:
+            self._save_manifest()
+
+    def _cache_path(self, file_path: str, options: InstrumentOptions) -> Path:
+        """Cache entry for a file's current (mtime, size) and the given options"""
+        st = os.stat(file_path)
+        key = hashlib.blake2b(
+            f'{file_path}:{st.st_mtime_ns}:{st.st_size}:{_options_key(options)}'.encode(),
+            digest_size=16
+        ).hexdigest()
+        # Not .py, so linters and test collectors never pick entries up
+        return self._cache_dir / f'{key}.src'
+
+    def _load_cached(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a cached transform, treating any unreadable entry as a miss"""
+        meta_path = cache_path.with_suffix('.json')
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            src = cache_path.read_text(encoding='utf-8')
+            functions_wrapped = int(meta['functions_wrapped'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        # Reuse keeps the entry clear of _prune_cache
+        try:
+            os.utime(cache_path)
+            os.utime(meta_path)
+        except OSError:
+            pass
 
-    def _is_instrumented(self, code: str) -> bool:
+        return {'src': src, 'functions_wrapped': functions_wrapped}
+
+    def _store_cached(self, cache_path: Path, src: str, functions_wrapped: int) -> None:
+        """Persist a transform result; failures only cost a future re-parse"""
+        # The sidecar is written last, so an entry without one is never read
+        try:
+            cache_path.write_text(src, encoding='utf-8')
+            with open(cache_path.with_suffix('.json'), 'w', encoding='utf-8') as f:
+                json.dump({'functions_wrapped': functions_wrapped}, f)
+        except OSError:
+            pass
+
+    def _prune_cache(self) -> None:
+        """Delete cached transforms that have not been used recently"""
+        cutoff = time.time() - _CACHE_MAX_AGE
+        try:
+            entries = list(os.scandir(self._cache_dir))
+        except OSError:
+            return
+
+        for entry in entries:
+            try:
+                # .pkl and .py entries are from older formats nothing reads
+                if entry.name.endswith(('.pkl', '.py')) or entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+
+    def _is_instrumented(self, code: bytes) -> bool:
         """Check if code is already instrumented"""
-        return '__tracer' in code or 'from .ai_agents.logging.runtime.tracer' in code
+        return _TRACER_RE.search(code) is not None
 
-    def _remove_instrumentation(self, code: str) -> str:
+    def _remove_instrumentation(self, code: bytes) -> bytes:
         """Remove instrumentation from code"""
-        # Simple approach: remove import and __tracer calls
-        lines = code.split('\n')
-        cleaned_lines = []
-
-        for line in lines:
-            if '__tracer' not in line and 'from .ai_agents.logging.runtime.tracer' not in line:
-                cleaned_lines.append(line)
+        # Simple approach: drop every line mentioning the import or __tracer
+        return _TRACER_LINE_RE.sub(b'', code)
 
-        return '\n'.join(cleaned_lines)
+    def _create_backup(self, content: bytes) -> Path:
+        """Create content-addressed backup of original file"""
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        backup_path = self._blob_dir / digest[:2] / digest
 
-    def _create_backup(self, file_path: str, content: str) -> Path:
-        """Create backup of original file"""
-        relative_path = Path(file_path).relative_to(Path.cwd())
-        backup_path = self.backup_dir / relative_path
+        # Same content is already stored
+        if backup_path.exists():
+            return backup_path
 
-        # Ensure directory exists
-        backup_path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure directory exists (once per directory per instrumenter)
+        parent = backup_path.parent
+        if parent not in self._created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
 
         # Write backup
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        self._write_atomic(backup_path, content)
 
         return backup_path
 
+    def _write_atomic(self, path: Union[str, Path], content: bytes) -> None:
+        """Write via a temp file and rename so readers never see a partial file"""
+        # Per-process name: pool workers may back up identical content at once
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+
+    def _write_if_changed(self, path: Union[str, Path], content: bytes, current: bytes) -> bool:
+        """Write only if content differs from what is on disk, keeping mtime otherwise"""
+        if content == current:
+            return False
+        self._write_atomic(path, content)
+        return True
+
+    def _find_backup(self, file_path: str) -> Path:
+        """Locate the backup recorded for a file, falling back to the mirror tree"""
+        entry = self._manifest.get(os.path.abspath(file_path))
+        if entry is not None and 'backup' in entry:
+            return Path(entry['backup'])
+        return self._get_backup_path(file_path)
+
     def _get_backup_path(self, file_path: str) -> Path:
-        """Get backup path for file"""
-        relative_path = Path(file_path).relative_to(Path.cwd())
+        """Get legacy mirror-tree backup path for file"""
+        relative_path = Path(file_path).relative_to(self._cwd)
         return self.backup_dir / relative_path
+
+
+_worker_instrumenter: Optional[PythonInstrumenter] = None
+
+
+def _init_worker() -> None:
+    """Create one instrumenter per pool process"""
+    global _worker_instrumenter
+    _worker_instrumenter = PythonInstrumenter()
+    _worker_instrumenter._persist_manifest = False
+
+
+def _pool_usable() -> bool:
+    """Whether pool workers can reach _instrument_one"""
+    # Tasks are pickled by module name. Only forked workers already hold this
+    # module; spawn/forkserver would re-import it, and python.adapter.py is
+    # not an importable name. Loading it from a path without registering it
+    # in sys.modules breaks pickling outright.
+    # allow_none: asking without it would fix the process-wide start method,
+    # breaking a host that calls set_start_method later
+    method = multiprocessing.get_start_method(allow_none=True)
+    if method is None:
+        # Platform default, which get_all_start_methods() lists first
+        method = multiprocessing.get_all_start_methods()[0]
+    if method != 'fork':
+        return False
+    module = sys.modules.get(__name__)
+    return getattr(module, '_instrument_one', None) is _instrument_one
+
+
+def _instrument_one(file_path: str, options: InstrumentOptions) -> Dict[str, Any]:
+    """Pool task for instrument_files; module-level so it can be pickled"""
+    return _worker_instrumenter.instrument_file(file_path, options)
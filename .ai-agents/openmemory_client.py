@@ -7,13 +7,141 @@
 context retrieval, and development history tracking.
 """
 
+import asyncio
+import atexit
+import gzip
+import queue
 import requests
 import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 
+# orjson is several times faster than the stdlib for both directions; keep
+# json as a fallback so the client has no hard dependency on it
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+# Read results are cached per client for a short time; any write to a
+# project bumps its version so later reads miss and go to the server
+_QUERY_CACHE_TTL = 60.0
+_CONTEXT_CACHE_TTL = 15.0
+_CACHE_MAXSIZE = 256
+_MISS = object()
+
+# Healthy /health responses are remembered on disk, keyed by base URL, so
+# short-lived scripts that check health on startup skip the round trip
+_HEALTH_CACHE_TTL = 300.0
+_HEALTH_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "openmemory"
+    / "health.json"
+)
+
+# With compress=True, project state bodies above this size are gzipped.
+# Level 1 gets most of the ratio on text-heavy JSON for little CPU.
+_GZIP_MIN_BYTES = 4096
+_GZIP_LEVEL = 1
+
+# ijson parses list endpoints incrementally off the socket instead of holding
+# the raw body and the decoded list at once. Only its C backend is fast enough
+# to be worth it over orjson on the buffered body.
+try:
+    import ijson
+
+    if ijson.backend != "yajl2_c":
+        ijson = None
+except ImportError:
+    ijson = None
+
+# httpx (with the http2 extra) multiplexes concurrent requests over a single
+# HTTP/2 connection; opt in with use_httpx=True
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# aiohttp is only needed for the async batch API
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Every request sends JSON, so these are set once on each session instead of
+# being merged in per call
+_DEFAULT_HEADERS = MappingProxyType({
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "User-Agent": "openmemory-client/1.0",
+})
+
+# Agents fire bursts of record_* calls, so keep a deeper keep-alive pool than
+# requests' default of 10. Writes are only retried when the connection could
+# not be established, never after the server may have stored them.
+_POOL_CONNECTIONS = 16
+_POOL_MAXSIZE = 64
+_RETRY = Retry(
+    total=3,
+    connect=3,
+    read=0,
+    status=3,
+    backoff_factor=0.1,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,
+)
+
+
+class _ClientBase:
+    """Project resolution and payload building shared by the sync and async clients"""
+
+    def _init_common(
+        self,
+        base_url: str,
+        api_key: Optional[str],
+        user_id: str,
+        project_name: Optional[str],
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.user_id = user_id
+        self.project_name = project_name
+        self._prefix = f"{self.base_url}/ai-agents"
+        self._base_payload = {"user_id": user_id}
+        self._user_params = {"user_id": user_id}
 
-class OpenMemoryClient:
+    def _resolve_project(self, project_name: Optional[str]) -> str:
+        project_name = project_name or self.project_name
+        if not project_name:
+            raise ValueError("project_name must be provided")
+        return project_name
+
+    def _payload(self, project_name: Optional[str], **extra: Any) -> Dict[str, Any]:
+        """Build a request payload carrying user_id and the resolved project_name"""
+        payload = self._base_payload.copy()
+        payload["project_name"] = self._resolve_project(project_name)
+        payload.update(extra)
+        return payload
+
+
+class OpenMemoryClient(_ClientBase):
     """Client for interacting with OpenMemory API"""
 
     def __init__(
@@ -22,6 +150,12 @@ def __init__(
         api_key: Optional[str] = None,
         user_id: str = "ai-agent-system",
         project_name: Optional[str] = None,
+        enable_cache: bool = True,
+        use_httpx: bool = False,
+        batch_writes: bool = False,
+        batch_max_items: int = 16,
+        batch_flush_ms: float = 50,
+        compress: bool = False,
     ):
         """
         Initialize OpenMemory client
@@ -31,29 +165,217 @@ def __init__(
             api_key: Optional API key for authentication
             user_id: User ID for memory isolation
             project_name: Default project name for operations
+            enable_cache: Cache query/pattern/decision/context reads briefly.
+                Cached lists and dicts are shared, so don't mutate them.
+            use_httpx: Talk HTTP/2 through httpx instead of requests (needs
+                httpx[http2]). Errors are then raised as httpx exceptions.
+            batch_writes: Queue record_action/record_emotion calls and send
+                them together; those methods then return a Future. Call
+                flush() to wait for queued writes (also done at exit).
+            batch_max_items: Most writes sent in one batch
+            batch_flush_ms: How long to wait for more writes before sending
+            compress: Gzip large save_project_state bodies (needs a server
+                that accepts Content-Encoding: gzip)
         """
-        self.base_url = base_url.rstrip("/")
-        self.api_key = api_key
-        self.user_id = user_id
-        self.project_name = project_name
-        self.session = requests.Session()
+        self._init_common(base_url, api_key, user_id, project_name)
+        self.enable_cache = enable_cache
+        self.compress = compress
+        self._cache: Dict[tuple, tuple] = {}
+        self._cache_versions: Dict[str, int] = {}
+        # Guards the cache and version maps; one client may serve several
+        # threads, including the batch writer's
+        self._cache_lock = threading.Lock()
+        self._etags: Dict[str, tuple] = {}
+        self._httpx = use_httpx
+
+        if use_httpx:
+            if httpx is None:
+                raise ImportError("use_httpx=True requires httpx[http2]")
+            # A custom transport ignores the client's http2/limits arguments,
+            # so they go on the transport. timeout=None matches requests.
+            self.session = httpx.Client(
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=_RETRY.connect,
+                    limits=httpx.Limits(
+                        max_connections=_POOL_MAXSIZE,
+                        max_keepalive_connections=_POOL_CONNECTIONS,
+                    ),
+                ),
+                timeout=None,
+            )
+        else:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=_POOL_CONNECTIONS,
+                pool_maxsize=_POOL_MAXSIZE,
+                max_retries=_RETRY,
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
 
+        self.session.headers.update(_DEFAULT_HEADERS)
         if api_key:
-            self.session.headers.update({"Authorization": f"Bearer {api_key}"})
+            self.session.headers["Authorization"] = f"Bearer {api_key}"
+
+        self._batch_writer = None
+        if batch_writes:
+            self._batch_writer = _BatchWriter(self, batch_max_items, batch_flush_ms / 1000)
+            atexit.register(self.flush)
+
+    def __enter__(self) -> "OpenMemoryClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Send any queued batch writes and close the pooled HTTP session"""
+        self.flush()
+        self.session.close()
+
+    def flush(self) -> None:
+        """Block until all queued batch writes have been sent"""
+        if self._batch_writer is not None:
+            self._batch_writer.flush()
+
+    def _post(self, path: str, payload: Dict[str, Any], compress: bool = False) -> Any:
+        """POST a JSON payload to an API path and return the decoded body"""
+        body = _dumps(payload)
+        headers = None
+        if compress and len(body) > _GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=_GZIP_LEVEL)
+            headers = {"Content-Encoding": "gzip"}
+
+        if self._httpx:
+            # httpx takes raw bytes as content=; data= is for form fields
+            response = self.session.post(
+                f"{self._prefix}{path}",
+                content=body,
+                headers=headers,
+            )
+        else:
+            response = self.session.post(
+                f"{self._prefix}{path}",
+                data=body,
+                headers=headers,
+            )
+        response.raise_for_status()
+        return _loads(response.content)
+
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET an API path and return the decoded body"""
+        response = self.session.get(f"{self._prefix}{path}", params=params)
+        response.raise_for_status()
+        return _loads(response.content)
+
+    def _get_revalidated(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET an API path, reusing the last body when the server answers 304"""
+        url = f"{self._prefix}{path}"
+        seen = self._etags.get(url)
+        headers = {"If-None-Match": seen[0]} if seen else None
+
+        response = self.session.get(url, params=params, headers=headers)
+        if seen and response.status_code == 304:
+            return seen[1]
+        response.raise_for_status()
+
+        data = _loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etags[url] = (etag, data)
+        return data
+
+    def _get_items(
+        self,
+        path: str,
+        key: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """GET a list endpoint and return the array stored under key"""
+        if ijson is None or self._httpx:
+            return self._get(path, params=params).get(key, [])
+
+        with self.session.get(
+            f"{self._prefix}{path}",
+            params=params,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            return list(ijson.items(response.raw, f"{key}.item", use_float=True))
+
+    def _cache_key(self, project_name: str, *parts: Any) -> tuple:
+        with self._cache_lock:
+            return (project_name, self._cache_versions.get(project_name, 0)) + parts
+
+    def _cache_get(self, key: tuple) -> Any:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return _MISS
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                self._cache.pop(key, None)
+                return _MISS
+            return value
+
+    def _cache_put(self, key: tuple, value: Any, ttl: float) -> None:
+        if not self.enable_cache:
+            return
+        with self._cache_lock:
+            if len(self._cache) >= _CACHE_MAXSIZE:
+                # Dicts keep insertion order, so this evicts the oldest entry
+                self._cache.pop(next(iter(self._cache)), None)
+            self._cache[key] = (value, time.monotonic() + ttl)
+
+    def _invalidate(self, project_name: Optional[str] = None) -> None:
+        """Make cached reads for a project (or every project) stale"""
+        if project_name is None:
+            self.clear_cache()
+        else:
+            with self._cache_lock:
+                self._cache_versions[project_name] = self._cache_versions.get(project_name, 0) + 1
+
+    def clear_cache(self) -> None:
+        """Drop all cached read results"""
+        with self._cache_lock:
+            self._cache.clear()
+            self._etags.clear()
+
+    def health_check(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Check if OpenMemory server is available
+
+        Args:
+            force: Ask the server even if a recent healthy result is cached
+
+        Returns:
+            Health dict, or {} if the server is unreachable
+        """
+        if not force:
+            cached = _read_health_cache(self.base_url)
+            if cached is not None:
+                return cached
 
-    def health_check(self) -> Dict[str, Any]:
-        """Check if OpenMemory server is available"""
         try:
             response = self.session.get(f"{self.base_url}/health")
-            return response.json() if response.status_code == 200 else {}
+            if response.status_code != 200:
+                return {}
+            health = _loads(response.content)
         except Exception as e:
             print(f"[OpenMemory] Health check failed: {e}")
             return {}
 
+        if health.get("ok"):
+            _write_health_cache(self.base_url, health)
+        return health
+
     def save_project_state(
         self,
         state: Dict[str, Any],
         project_name: Optional[str] = None,
+        compress: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         Save project state to OpenMemory
@@ -61,26 +383,21 @@ def save_project_state(
         Args:
             state: Project state dictionary
             project_name: Project name (uses default if not provided)
+            compress: Gzip a large body (uses the client setting if not provided)
 
         Returns:
             Response dict with memory_id
         """
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
-
-        payload = {
-            "project_name": project_name,
-            "state": state,
-            "user_id": self.user_id,
-        }
-
-        response = self.session.post(
-            f"{self.base_url}/ai-agents/state",
-            json=payload,
+        payload = self._payload(
+            project_name,
+            state=state,
         )
-        response.raise_for_status()
-        return response.json()
+
+        if compress is None:
+            compress = self.compress
+        result = self._post("/state", payload, compress=compress)
+        self._invalidate(payload["project_name"])
+        return result
 
     def load_project_state(
         self,
@@ -95,22 +412,19 @@ def load_project_state(
         Returns:
             Project state dict or None if not found
         """
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
+        project_name = self._resolve_project(project_name)
 
         try:
             response = self.session.get(
-                f"{self.base_url}/ai-agents/state/{project_name}",
-                params={"user_id": self.user_id},
+                f"{self._prefix}/state/{project_name}",
+                params=self._user_params,
             )
 
             if response.status_code == 404:
                 return None
 
             response.raise_for_status()
-            data = response.json()
-            return data.get("state")
+            return _loads(response.content).get("state")
         except Exception as e:
             print(f"[OpenMemory] Error loading project state: {e}")
             return None
@@ -154,29 +468,68 @@ def record_action(
             project_name: Project name (uses default if not provided)
 
         Returns:
-            Response dict with memory_id and links
+            Response dict with memory_id and links, or a Future resolving
+            to it when batch_writes is enabled
         """
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
+        payload = self._payload(
+            project_name,
+            agent_name=agent_name,
+            action=action,
+            context=context,
+            outcome=outcome,
+            related_decision=related_decision,
+            used_pattern=used_pattern,
+        )
 
-        payload = {
-            "project_name": project_name,
-            "agent_name": agent_name,
-            "action": action,
-            "context": context,
-            "outcome": outcome,
-            "related_decision": related_decision,
-            "used_pattern": used_pattern,
-            "user_id": self.user_id,
-        }
+        # Queued writes are invalidated by the batch writer once sent
+        if self._batch_writer is not None:
+            return self._batch_writer.submit("action", payload)
+        result = self._post("/action", payload)
+        self._invalidate(payload["project_name"])
+        return result
 
-        response = self.session.post(
-            f"{self.base_url}/ai-agents/action",
-            json=payload,
-        )
-        response.raise_for_status()
-        return response.json()
+    def record_actions_batch(
+        self,
+        actions: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Record many agent actions in one request
+
+        Args:
+            actions: List of record_action keyword argument dicts
+
+        Returns:
+            List of response dicts, in the same order as actions. An action
+            the server rejected has an "err" key.
+
+        Sent as a single POST /ai-agents/batch. Against an older server
+        without that endpoint, falls back to concurrent requests through
+        AsyncOpenMemoryClient when aiohttp is installed, otherwise records
+        the actions one at a time. The fallback must not run inside a
+        running event loop; await AsyncOpenMemoryClient directly there.
+        """
+        try:
+            return self.bulk_store(actions=actions)["actions"]
+        except Exception as e:
+            if _status_code(e) != 404:
+                raise
+
+        if aiohttp is None:
+            return [self.record_action(**action) for action in actions]
+
+        async def run():
+            async with AsyncOpenMemoryClient(
+                base_url=self.base_url,
+                api_key=self.api_key,
+                user_id=self.user_id,
+                project_name=self.project_name,
+            ) as client:
+                return await client.record_actions_batch(actions)
+
+        results = asyncio.run(run())
+        for project_name in {a.get("project_name") or self.project_name for a in actions}:
+            self._invalidate(project_name)
+        return results
 
     def store_pattern(
         self,
@@ -199,25 +552,17 @@ def store_pattern(
         Returns:
             Response dict with memory_id
         """
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
-
-        payload = {
-            "project_name": project_name,
-            "pattern_name": pattern_name,
-            "description": description,
-            "example": example,
-            "tags": tags or [],
-            "user_id": self.user_id,
-        }
-
-        response = self.session.post(
-            f"{self.base_url}/ai-agents/pattern",
-            json=payload,
+        payload = self._payload(
+            project_name,
+            pattern_name=pattern_name,
+            description=description,
+            example=example,
+            tags=tags or [],
         )
-        response.raise_for_status()
-        return response.json()
+
+        result = self._post("/pattern", payload)
+        self._invalidate(payload["project_name"])
+        return result
 
     def record_decision(
         self,
@@ -240,25 +585,64 @@ def record_decision(
         Returns:
             Response dict with memory_id
         """
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
+        payload = self._payload(
+            project_name,
+            decision=decision,
+            rationale=rationale,
+            alternatives=alternatives,
+            consequences=consequences,
+        )
 
-        payload = {
-            "project_name": project_name,
-            "decision": decision,
-            "rationale": rationale,
-            "alternatives": alternatives,
-            "consequences": consequences,
-            "user_id": self.user_id,
-        }
+        result = self._post("/decision", payload)
+        self._invalidate(payload["project_name"])
+        return result
 
-        response = self.session.post(
-            f"{self.base_url}/ai-agents/decision",
-            json=payload,
+    def bulk_store(
+        self,
+        patterns: Optional[List[Dict[str, Any]]] = None,
+        decisions: Optional[List[Dict[str, Any]]] = None,
+        actions: Optional[List[Dict[str, Any]]] = None,
+        project_name: Optional[str] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Store patterns, decisions and actions in a single request
+
+        Args:
+            patterns: List of store_pattern keyword argument dicts
+            decisions: List of record_decision keyword argument dicts
+            actions: List of record_action keyword argument dicts
+            project_name: Project name for entries that don't set one
+
+        Returns:
+            Dict with "patterns", "decisions" and "actions" lists of response
+            dicts, in input order. An entry the server rejected has an "err".
+
+        The server stores the entries in order: patterns, then decisions,
+        then actions.
+        """
+        groups = (
+            ("patterns", "pattern", patterns or []),
+            ("decisions", "decision", decisions or []),
+            ("actions", "action", actions or []),
         )
-        response.raise_for_status()
-        return response.json()
+
+        items = []
+        for _, kind, entries in groups:
+            for entry in entries:
+                entry = dict(entry)
+                item = self._payload(entry.pop("project_name", None) or project_name, type=kind, **entry)
+                if kind == "pattern":
+                    item["tags"] = item.get("tags") or []
+                items.append(item)
+
+        results = iter(self._post("/batch", {"items": items}).get("results", []))
+        for name in {item["project_name"] for item in items}:
+            self._invalidate(name)
+
+        return {
+            key: [next(results, {"err": "missing result"}) for _ in entries]
+            for key, _, entries in groups
+        }
 
     def query_memories(
         self,
@@ -279,25 +663,76 @@ def query_memories(
         Returns:
             List of matching memories
         """
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
+        project_name = self._resolve_project(project_name)
+
+        key = self._cache_key(project_name, "query", query, memory_type, k)
+        cached = self._cache_get(key)
+        if cached is not _MISS:
+            return cached
+
+        payload = self._payload(
+            project_name,
+            query=query,
+            memory_type=memory_type,
+            k=k,
+        )
 
-        payload = {
-            "project_name": project_name,
-            "query": query,
-            "memory_type": memory_type,
-            "k": k,
-            "user_id": self.user_id,
-        }
+        data = self._post("/query", payload)
+        results = data.get("results", [])
+        self._cache_put(key, results, _QUERY_CACHE_TTL)
+        return results
 
-        response = self.session.post(
-            f"{self.base_url}/ai-agents/query",
-            json=payload,
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("results", [])
+    def query_memories_batch(
+        self,
+        queries: List[Dict[str, Any]],
+        project_name: Optional[str] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several project memory queries in one request
+
+        Args:
+            queries: List of dicts with "query" and optionally "memory_type"
+                and "k", as for query_memories
+            project_name: Project name (uses default if not provided)
+
+        Returns:
+            List of result lists, in the same order as queries
+        """
+        project_name = self._resolve_project(project_name)
+
+        results: List[Any] = []
+        missing = []
+        for item in queries:
+            item = {"memory_type": "all", "k": 10, **item}
+            key = self._cache_key(project_name, "query", item["query"], item["memory_type"], item["k"])
+            cached = self._cache_get(key)
+            results.append(cached)
+            if cached is _MISS:
+                missing.append((len(results) - 1, key, item))
+
+        if not missing:
+            return results
+
+        payload = self._payload(project_name, queries=[item for _, _, item in missing])
+        try:
+            data = self._post("/query-batch", payload)
+        except Exception as e:
+            if _status_code(e) != 404:
+                raise
+            # Older server without /ai-agents/query-batch
+            for index, _, item in missing:
+                results[index] = self.query_memories(project_name=project_name, **item)
+            return results
+
+        outs = data.get("results", [])
+        if len(outs) != len(missing):
+            raise RuntimeError("[OpenMemory] Query batch returned the wrong number of results")
+        for (index, key, _), out in zip(missing, outs):
+            if "err" in out:
+                raise RuntimeError(f"[OpenMemory] Query failed: {out['err']}")
+            results[index] = out.get("results", [])
+            self._cache_put(key, results[index], _QUERY_CACHE_TTL)
+        return results
 
     def get_history(
         self,
@@ -314,17 +749,13 @@ def get_history(
         Returns:
             List of historical actions
         """
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
+        project_name = self._resolve_project(project_name)
 
-        response = self.session.get(
-            f"{self.base_url}/ai-agents/history/{project_name}",
+        return self._get_items(
+            f"/history/{project_name}",
+            "history",
             params={"limit": limit, "user_id": self.user_id},
         )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("history", [])
 
     def get_patterns(
         self,
@@ -339,17 +770,20 @@ def get_patterns(
         Returns:
             List of patterns
         """
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
+        project_name = self._resolve_project(project_name)
 
-        response = self.session.get(
-            f"{self.base_url}/ai-agents/patterns/{project_name}",
-            params={"user_id": self.user_id},
+        key = self._cache_key(project_name, "patterns")
+        cached = self._cache_get(key)
+        if cached is not _MISS:
+            return cached
+
+        patterns = self._get_items(
+            f"/patterns/{project_name}",
+            "patterns",
+            params=self._user_params,
         )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("patterns", [])
+        self._cache_put(key, patterns, _CONTEXT_CACHE_TTL)
+        return patterns
 
     def get_decisions(
         self,
@@ -364,17 +798,20 @@ def get_decisions(
         Returns:
             List of decisions
         """
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
+        project_name = self._resolve_project(project_name)
 
-        response = self.session.get(
-            f"{self.base_url}/ai-agents/decisions/{project_name}",
-            params={"user_id": self.user_id},
+        key = self._cache_key(project_name, "decisions")
+        cached = self._cache_get(key)
+        if cached is not _MISS:
+            return cached
+
+        decisions = self._get_items(
+            f"/decisions/{project_name}",
+            "decisions",
+            params=self._user_params,
         )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("decisions", [])
+        self._cache_put(key, decisions, _CONTEXT_CACHE_TTL)
+        return decisions
 
     def get_full_context(
         self,
@@ -389,17 +826,20 @@ def get_full_context(
         Returns:
             Dict with comprehensive context
         """
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
+        project_name = self._resolve_project(project_name)
+
+        key = self._cache_key(project_name, "context")
+        cached = self._cache_get(key)
+        if cached is not _MISS:
+            return cached
 
-        response = self.session.get(
-            f"{self.base_url}/ai-agents/context/{project_name}",
-            params={"user_id": self.user_id},
+        data = self._get(
+            f"/context/{project_name}",
+            params=self._user_params,
         )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("context", {})
+        context = data.get("context", {})
+        self._cache_put(key, context, _CONTEXT_CACHE_TTL)
+        return context
 
     # =========================================================================
     # NEW METHODS: Emotional Memory, Waypoints, Pattern Detection, Smart Reinforcement
@@ -428,29 +868,25 @@ def record_emotion(
             project_name: Project name
 
         Returns:
-            Response dict with memory_id
+            Response dict with memory_id, or a Future resolving to it when
+            batch_writes is enabled
         """
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
-
-        payload = {
-            "project_name": project_name,
-            "agent_name": agent_name,
-            "feeling": feeling,
-            "sentiment": sentiment,
-            "confidence": confidence,
-            "context": context,
-            "related_action": related_action,
-            "user_id": self.user_id,
-        }
-
-        response = self.session.post(
-            f"{self.base_url}/ai-agents/emotion",
-            json=payload,
+        payload = self._payload(
+            project_name,
+            agent_name=agent_name,
+            feeling=feeling,
+            sentiment=sentiment,
+            confidence=confidence,
+            context=context,
+            related_action=related_action,
         )
-        response.raise_for_status()
-        return response.json()
+
+        # Queued writes are invalidated by the batch writer once sent
+        if self._batch_writer is not None:
+            return self._batch_writer.submit("emotion", payload)
+        result = self._post("/emotion", payload)
+        self._invalidate(payload["project_name"])
+        return result
 
     def get_emotional_timeline(
         self,
@@ -458,33 +894,25 @@ def get_emotional_timeline(
         project_name: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Get emotional timeline for project"""
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
+        project_name = self._resolve_project(project_name)
 
-        response = self.session.get(
-            f"{self.base_url}/ai-agents/emotions/{project_name}",
+        return self._get_items(
+            f"/emotions/{project_name}",
+            "emotions",
             params={"limit": limit, "user_id": self.user_id},
         )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("emotions", [])
 
     def analyze_sentiment_trends(
         self,
         project_name: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Analyze sentiment trends over time"""
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
+        project_name = self._resolve_project(project_name)
 
-        response = self.session.get(
-            f"{self.base_url}/ai-agents/sentiment/{project_name}",
-            params={"user_id": self.user_id},
+        return self._get_revalidated(
+            f"/sentiment/{project_name}",
+            params=self._user_params,
         )
-        response.raise_for_status()
-        return response.json()
 
     def link_memories(
         self,
@@ -512,12 +940,9 @@ def link_memories(
             "relationship": relationship,
         }
 
-        response = self.session.post(
-            f"{self.base_url}/ai-agents/link",
-            json=payload,
-        )
-        response.raise_for_status()
-        return response.json()
+        result = self._post("/link", payload)
+        self._invalidate()
+        return result
 
     def get_memory_graph(
         self,
@@ -534,12 +959,10 @@ def get_memory_graph(
         Returns:
             Dict with waypoints and relationships
         """
-        response = self.session.get(
-            f"{self.base_url}/ai-agents/graph/{memory_id}",
+        return self._get(
+            f"/graph/{memory_id}",
             params={"depth": depth},
         )
-        response.raise_for_status()
-        return response.json()
 
     def trace_decision_to_actions(
         self,
@@ -573,23 +996,16 @@ def reinforce_memory_smart(
             "reason": reason,
         }
 
-        response = self.session.post(
-            f"{self.base_url}/ai-agents/smart-reinforce",
-            json=payload,
-        )
-        response.raise_for_status()
-        return response.json()
+        result = self._post("/smart-reinforce", payload)
+        self._invalidate()
+        return result
 
     def get_memory_metrics(
         self,
         memory_id: str,
     ) -> Dict[str, Any]:
         """Get importance metrics for a memory"""
-        response = self.session.get(
-            f"{self.base_url}/ai-agents/metrics/{memory_id}",
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = self._get(f"/metrics/{memory_id}")
         return data.get("metrics", {})
 
     def detect_patterns(
@@ -609,23 +1025,14 @@ def detect_patterns(
         Returns:
             List of detected patterns
         """
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
-
-        payload = {
-            "project_name": project_name,
-            "lookback_days": lookback_days,
-            "min_frequency": min_frequency,
-            "user_id": self.user_id,
-        }
-
-        response = self.session.post(
-            f"{self.base_url}/ai-agents/detect-patterns",
-            json=payload,
+        payload = self._payload(
+            project_name,
+            lookback_days=lookback_days,
+            min_frequency=min_frequency,
         )
-        response.raise_for_status()
-        data = response.json()
+
+        data = self._post("/detect-patterns", payload)
+        self._invalidate(payload["project_name"])
         return data.get("patterns", [])
 
     def get_most_important_memories(
@@ -645,24 +1052,325 @@ def get_most_important_memories(
         Returns:
             List of memories sorted by importance
         """
-        project_name = project_name or self.project_name
-        if not project_name:
-            raise ValueError("project_name must be provided")
+        payload = self._payload(
+            project_name,
+            memory_type=memory_type,
+            limit=limit,
+        )
 
-        payload = {
-            "project_name": project_name,
-            "memory_type": memory_type,
-            "limit": limit,
-            "user_id": self.user_id,
-        }
+        data = self._post("/important", payload)
+        return data.get("memories", [])
 
-        response = self.session.post(
-            f"{self.base_url}/ai-agents/important",
-            json=payload,
+
+def _load_health_entries() -> Dict[str, Any]:
+    try:
+        return _loads(_HEALTH_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def _read_health_cache(base_url: str) -> Optional[Dict[str, Any]]:
+    """Cached health for base_url if it was stored within the TTL"""
+    entry = _load_health_entries().get(base_url)
+    if not entry or time.time() - entry.get("checked_at", 0) >= _HEALTH_CACHE_TTL:
+        return None
+    return entry.get("health")
+
+
+def _write_health_cache(base_url: str, health: Dict[str, Any]) -> None:
+    entries = _load_health_entries()
+    entries[base_url] = {"checked_at": time.time(), "health": health}
+    tmp_path = _HEALTH_CACHE_PATH.with_name(f"{_HEALTH_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        _HEALTH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(_dumps(entries))
+        os.replace(tmp_path, _HEALTH_CACHE_PATH)
+    except OSError:
+        # The cache is only an optimization; never fail a health check over it
+        pass
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """HTTP status of a requests/httpx error, if it carries a response"""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+class _BatchWriter:
+    """Coalesces queued writes into POST /ai-agents/batch calls on a background thread"""
+
+    # Single-item endpoints used when the server has no batch endpoint
+    _PATHS = {"action": "/action", "emotion": "/emotion"}
+
+    def __init__(self, client: OpenMemoryClient, max_items: int, flush_seconds: float):
+        self._client = client
+        self._max_items = max_items
+        self._flush_seconds = flush_seconds
+        self._queue: "queue.Queue" = queue.Queue()
+        # None until the first batch tells us whether the server supports it
+        self._batch_supported: Optional[bool] = None
+        self._thread = threading.Thread(
+            target=self._run,
+            name="openmemory-batch-writer",
+            daemon=True,
         )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("memories", [])
+        self._thread.start()
+
+    def submit(self, kind: str, payload: Dict[str, Any]) -> Future:
+        future: Future = Future()
+        self._queue.put((kind, payload, future))
+        return future
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._flush_seconds
+            while len(batch) < self._max_items:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            live = [item for item in batch if item[2].set_running_or_notify_cancel()]
+            try:
+                self._send(live)
+            except BaseException as e:
+                # Anything unexpected fails this batch, not the thread:
+                # flush() and close() wait on task_done() for every item
+                for _, _, future in live:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _send(self, batch: List[tuple]) -> None:
+        if not batch:
+            return
+
+        if self._batch_supported is not False:
+            items = [dict(payload, type=kind) for kind, payload, _ in batch]
+            try:
+                data = self._client._post("/batch", {"items": items})
+            except Exception as e:
+                if _status_code(e) != 404:
+                    for _, _, future in batch:
+                        future.set_exception(e)
+                    return
+                self._batch_supported = False
+            else:
+                self._batch_supported = True
+                self._invalidate(batch)
+                results = data.get("results") or []
+                for index, (_, _, future) in enumerate(batch):
+                    result = results[index] if index < len(results) else None
+                    if result is None:
+                        future.set_exception(RuntimeError("[OpenMemory] Batch response has no result for this write"))
+                    elif "err" in result:
+                        error = RuntimeError(f"[OpenMemory] Batch write failed: {result['err']}")
+                        future.set_exception(error)
+                    else:
+                        future.set_result(result)
+                return
+
+        # Older server without /ai-agents/batch: send each write on its own
+        for kind, payload, future in batch:
+            try:
+                result = self._client._post(self._PATHS[kind], payload)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                self._invalidate([(kind, payload, future)])
+                future.set_result(result)
+
+    def _invalidate(self, batch: List[tuple]) -> None:
+        # Only once the writes have landed; reads made while they sat in the
+        # queue would otherwise cache pre-write results
+        for project_name in {payload["project_name"] for _, payload, _ in batch}:
+            self._client._invalidate(project_name)
+
+
+class AsyncOpenMemoryClient(_ClientBase):
+    """Asyncio client for firing many OpenMemory writes concurrently (requires aiohttp)"""
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8080",
+        api_key: Optional[str] = None,
+        user_id: str = "ai-agent-system",
+        project_name: Optional[str] = None,
+        limit: int = 32,
+    ):
+        """
+        Initialize async OpenMemory client
+
+        Args:
+            base_url: Base URL of OpenMemory server
+            api_key: Optional API key for authentication
+            user_id: User ID for memory isolation
+            project_name: Default project name for operations
+            limit: Maximum number of concurrent connections
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncOpenMemoryClient requires aiohttp")
+
+        self._init_common(base_url, api_key, user_id, project_name)
+        self.limit = limit
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncOpenMemoryClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # Created lazily so the session binds to the loop that uses it
+        if self._session is None or self._session.closed:
+            headers = dict(_DEFAULT_HEADERS)
+            if self.api_key:
+                headers["Authorization"] = f"Bearer {self.api_key}"
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit, keepalive_timeout=60),
+                headers=headers,
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _post(self, path: str, payload: Dict[str, Any]) -> Any:
+        """POST a JSON payload to an API path and return the decoded body"""
+        async with self._get_session().post(
+            f"{self._prefix}{path}",
+            data=_dumps(payload),
+        ) as response:
+            response.raise_for_status()
+            return _loads(await response.read())
+
+    async def arecord_action(
+        self,
+        agent_name: str,
+        action: str,
+        context: Optional[str] = None,
+        outcome: Optional[str] = None,
+        related_decision: Optional[str] = None,
+        used_pattern: Optional[str] = None,
+        project_name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Record an agent action in episodic memory (see OpenMemoryClient.record_action)"""
+        payload = self._payload(
+            project_name,
+            agent_name=agent_name,
+            action=action,
+            context=context,
+            outcome=outcome,
+            related_decision=related_decision,
+            used_pattern=used_pattern,
+        )
+
+        return await self._post("/action", payload)
+
+    async def astore_pattern(
+        self,
+        pattern_name: str,
+        description: str,
+        example: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        project_name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Store a coding pattern in procedural memory (see OpenMemoryClient.store_pattern)"""
+        payload = self._payload(
+            project_name,
+            pattern_name=pattern_name,
+            description=description,
+            example=example,
+            tags=tags or [],
+        )
+
+        return await self._post("/pattern", payload)
+
+    async def arecord_decision(
+        self,
+        decision: str,
+        rationale: str,
+        alternatives: Optional[str] = None,
+        consequences: Optional[str] = None,
+        project_name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Record an architectural decision in reflective memory (see OpenMemoryClient.record_decision)"""
+        payload = self._payload(
+            project_name,
+            decision=decision,
+            rationale=rationale,
+            alternatives=alternatives,
+            consequences=consequences,
+        )
+
+        return await self._post("/decision", payload)
+
+    async def record_actions_batch(
+        self,
+        actions: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Record many agent actions concurrently
+
+        Args:
+            actions: List of arecord_action keyword argument dicts
+
+        Returns:
+            List of response dicts, in the same order as actions
+        """
+        return await asyncio.gather(*[self.arecord_action(**action) for action in actions])
+
+
+_clients: Dict[tuple, OpenMemoryClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(
+    base_url: str = "http://localhost:8080",
+    api_key: Optional[str] = None,
+    user_id: str = "ai-agent-system",
+    project_name: Optional[str] = None,
+) -> OpenMemoryClient:
+    """
+    Get a shared OpenMemoryClient for these settings
+
+    Clients are created on first use and then reused for the life of the
+    process, so code that runs several scripts in one interpreter keeps a
+    single warm connection pool. Don't close() a shared client.
+
+    Args:
+        base_url: Base URL of OpenMemory server
+        api_key: Optional API key for authentication
+        user_id: User ID for memory isolation
+        project_name: Default project name for operations
+
+    Returns:
+        The OpenMemoryClient for this combination of settings
+    """
+    key = (base_url, api_key, user_id, project_name)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = OpenMemoryClient(
+                base_url=base_url,
+                api_key=api_key,
+                user_id=user_id,
+                project_name=project_name,
+            )
+        return client
 
 
 def main():
@@ -9,8 +9,19 @@
 sys.path.insert(0, '..')
 
 from openmemory_client import OpenMemoryClient
+import math
+import signal
+import threading
 import time
 
+# Set by SIGTERM/SIGINT so scheduled mode wakes up and exits immediately
+_stop = threading.Event()
+
+def importance_score(memory):
+    """Importance as computed by the server: salience * (1 + ln(1 + coactivations))"""
+    salience = memory.get('salience') or 0.5
+    return salience * (1 + math.log1p(memory.get('coactivations') or 0))
+
 def run_pattern_detection(client, lookback_days=7, min_frequency=3):
     """
     Run automatic pattern detection
@@ -46,25 +57,11 @@ def run_pattern_detection(client, lookback_days=7, min_frequency=3):
                 print(f"   Frequency: {frequency} times")
                 print(f"   Memory ID: {memory_id}")
 
-                # Get pattern details
-                try:
-                    from openmemory_client import OpenMemoryClient
-                    # Query to get full pattern details
-                    results = client.query_memories(
-                        query=name,
-                        memory_type='patterns',
-                        k=1
-                    )
-                    if results:
-                        content = results[0].get('content', '')
-                        # Extract description
-                        if 'Common sequence observed:' in content:
-                            desc_start = content.index('Common sequence observed:')
-                            desc_end = content.index('Observed') if 'Observed' in content[desc_start:] else len(content)
-                            description = content[desc_start:desc_end].strip()
-                            print(f"\n   {description}")
-                except Exception as e:
-                    pass
+                # The server returns the description with each detected
+                # pattern, so no follow-up query per pattern is needed
+                description = pattern.get('description')
+                if description:
+                    print(f"\n   {description}")
 
             print(f"\n💡 These patterns are now stored in procedural memory and can be:")
             print(f"   • Queried with: client.query_memories('pattern name', memory_type='patterns')")
@@ -87,17 +84,15 @@ def run_pattern_detection(client, lookback_days=7, min_frequency=3):
         print(f"   Auto-detected: {len(auto_detected)}")
         print(f"   Manually recorded: {len(all_patterns) - len(auto_detected)}")
 
-        # Get most important patterns
-        important = client.get_most_important_memories(
-            memory_type='patterns',
-            limit=5
-        )
+        # Rank the patterns we already fetched the same way the server's
+        # /important endpoint does, instead of querying for them again
+        important = sorted(all_patterns, key=importance_score, reverse=True)[:5]
 
         if important:
             print(f"\n🏆 Top Patterns (by importance):")
             for i, pattern in enumerate(important, 1):
                 content = pattern.get('content', '')[:60]
-                score = pattern.get('importance_score', 0.0)
+                score = importance_score(pattern)
                 coactivations = pattern.get('coactivations', 0)
 
                 print(f"\n   {i}. Score: {score:.2f}, Uses: {coactivations}")
@@ -123,52 +118,53 @@ def main():
     args = parser.parse_args()
 
     # Initialize client
-    client = OpenMemoryClient(
+    with OpenMemoryClient(
         base_url=args.base_url,
         project_name=args.project,
         user_id="ai-agent-system"
-    )
+    ) as client:
+        # Check health
+        health = client.health_check()
+        if not health.get("ok"):
+            print("❌ ERROR: OpenMemory server is not available")
+            print("Please start OpenMemory server first:")
+            print("  cd backend && npm run dev")
+            sys.exit(1)
 
-    # Check health
-    health = client.health_check()
-    if not health.get("ok"):
-        print("❌ ERROR: OpenMemory server is not available")
-        print("Please start OpenMemory server first:")
-        print("  cd backend && npm run dev")
-        sys.exit(1)
+        print(f"✓ Connected to OpenMemory (v{health.get('version', 'unknown')})")
 
-    print(f"✓ Connected to OpenMemory (v{health.get('version', 'unknown')})")
+        # Run detection
+        try:
+            if args.schedule:
+                print("\n🔄 Running in scheduled mode (every 24 hours)")
+                print("   Press Ctrl+C to stop\n")
+
+                signal.signal(signal.SIGTERM, lambda *_: _stop.set())
+                signal.signal(signal.SIGINT, lambda *_: _stop.set())
+
+                while not _stop.is_set():
+                    run_pattern_detection(
+                        client,
+                        lookback_days=args.lookback_days,
+                        min_frequency=args.min_frequency
+                    )
 
-    # Run detection
-    try:
-        if args.schedule:
-            print("\n🔄 Running in scheduled mode (every 24 hours)")
-            print("   Press Ctrl+C to stop\n")
+                    print(f"\n⏳ Next run in 24 hours...")
+                    if _stop.wait(timeout=86400):  # 24 hours
+                        break
 
-            while True:
+                print(f"\n\n✓ Scheduled detection stopped")
+            else:
+                # Single run
                 run_pattern_detection(
                     client,
                     lookback_days=args.lookback_days,
                     min_frequency=args.min_frequency
                 )
 
-                print(f"\n⏳ Next run in 24 hours...")
-                try:
-                    time.sleep(86400)  # 24 hours
-                except KeyboardInterrupt:
-                    print(f"\n\n✓ Scheduled detection stopped")
-                    break
-        else:
-            # Single run
-            run_pattern_detection(
-                client,
-                lookback_days=args.lookback_days,
-                min_frequency=args.min_frequency
-            )
-
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        sys.exit(1)
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()
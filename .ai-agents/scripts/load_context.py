@@ -4,11 +4,21 @@
 import sys
 sys.path.insert(0, '..')
 
-from openmemory_client import OpenMemoryClient
+from openmemory_client import get_client
+import argparse
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+parser = argparse.ArgumentParser(description='Load OpenMemory project context')
+parser.add_argument('--full', action='store_true', help='Print the whole project state instead of a summary')
+args = parser.parse_args()
+
 # Initialize client for the OpenMemory project itself
-client = OpenMemoryClient(
+client = get_client(
     base_url="http://localhost:8080",
     project_name="OpenMemory",
     user_id="ai-agent-system"
@@ -23,41 +33,58 @@
     print(f"  Embedding: {health.get('embedding', {}).get('provider')} ({health.get('dim')} dimensions)")
     print(f"  Tier: {health.get('tier')}\n")
 
-# Detect mode
-mode = client.detect_mode()
-print(f"Mode: {mode}\n")
+# One context request carries the mode, state and history
+try:
+    full_context = client.get_full_context()
+except Exception as e:
+    print(f"Could not fetch full context: {e}\n")
+    full_context = {}
+state = full_context.get('state')
+history = full_context.get('recent_actions', [])[-10:]
 
-# Load project state
+# /context caps patterns and decisions at 10, so list them in full
+patterns = client.get_patterns()
+decisions = client.get_decisions()
+
+print(f"Mode: {full_context.get('mode', 'INITIALIZE')}\n")
+
+# Project state
 print("=== Project State ===")
-state = client.load_project_state()
-if state:
-    print(json.dumps(state, indent=2))
+if state and args.full:
+    if orjson is not None:
+        print(orjson.dumps(state, option=orjson.OPT_INDENT_2).decode())
+    else:
+        print(json.dumps(state, indent=2))
+elif state:
+    metadata = state.get('project_metadata', {})
+    print(f"Project: {metadata.get('project_name')}")
+    print(f"Version: {metadata.get('version')}")
+    print(f"Phase: {metadata.get('current_phase')}")
+    print(f"Sectors: {len(state.get('architecture', {}).get('sectors', {}))}")
+    print("(run with --full for the complete state)")
 else:
     print("No project state found")
 
-# Get development history
+# Development history
 print("\n=== Development History (last 10 actions) ===")
-history = client.get_history(limit=10)
 if history:
-    for i, entry in enumerate(history[-10:], 1):
+    for i, entry in enumerate(history, 1):
         print(f"{i}. [{entry.get('agent_name', 'unknown')}] {entry.get('action', 'N/A')}")
         if entry.get('outcome'):
             print(f"   → {entry.get('outcome')}")
 else:
     print("No history found")
 
-# Get patterns
+# Patterns
 print("\n=== Coding Patterns ===")
-patterns = client.get_patterns()
 if patterns:
     for i, pattern in enumerate(patterns, 1):
         print(f"{i}. {pattern.get('pattern_name', 'N/A')}: {pattern.get('description', 'N/A')}")
 else:
     print("No patterns found")
 
-# Get architectural decisions
+# Architectural decisions
 print("\n=== Architectural Decisions ===")
-decisions = client.get_decisions()
 if decisions:
     for i, decision in enumerate(decisions, 1):
         print(f"{i}. {decision.get('decision', 'N/A')}")
@@ -65,15 +92,11 @@
 else:
     print("No decisions found")
 
-# Get full context
+# Full context summary
 print("\n=== Full Context Summary ===")
-try:
-    full_context = client.get_full_context()
-    print(f"State entries: {len(full_context.get('state_history', []))}")
-    print(f"Actions: {len(full_context.get('actions', []))}")
-    print(f"Patterns: {len(full_context.get('patterns', []))}")
-    print(f"Decisions: {len(full_context.get('decisions', []))}")
-except Exception as e:
-    print(f"Could not fetch full context: {e}")
+print(f"State entries: {1 if state else 0}")
+print(f"Actions: {len(full_context.get('recent_actions', []))}")
+print(f"Patterns: {len(patterns)}")
+print(f"Decisions: {len(decisions)}")
 
 print("\n=== Ready to work on OpenMemory project ===")
@@ -7,9 +7,27 @@
 import sys
 sys.path.insert(0, '..')
 
-from openmemory_client import OpenMemoryClient
+from datetime import datetime
+import hashlib
+import json
 import time
 
+# Back off while the trends stay the same: after this many identical checks
+# the interval doubles, up to the cap, and drops back on the first change
+UNCHANGED_CHECKS_BEFORE_BACKOFF = 3
+MAX_INTERVAL = 600
+
+_SENTIMENT_EMOJI = {
+    'positive': '😊',
+    'confident': '💪',
+    'negative': '😟',
+    'frustrated': '😤',
+    'neutral': '😐'
+}
+
+# One entry of the recent-emotions block: index, emoji, agent, confidence, feeling
+_EMOTION_TEMPLATE = '\n   {}. {} [{}] Confidence: {:.2f}\n      "{}"'
+
 def monitor_sentiment(client, continuous=False, interval=60):
     """
     Monitor agent sentiment and confidence
@@ -19,16 +37,43 @@ def monitor_sentiment(client, continuous=False, interval=60):
         continuous: If True, runs continuously
         interval: Seconds between checks (for continuous mode)
     """
+    wait = interval
+    last_hash = None
+    unchanged = 0
+
     while True:
         print("\n" + "="*70)
         print("AGENT SENTIMENT MONITORING")
         print("="*70)
-        print(f"Time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Time: {datetime.now().isoformat(sep=' ', timespec='seconds')}")
 
         # Get sentiment trends
         try:
             trends = client.analyze_sentiment_trends()
 
+            # Only fields that change with the sentiment itself: every query
+            # rewrites the emotions' salience, score and last_seen_at
+            stable = {
+                key: trends.get(key)
+                for key in ('trend', 'average_confidence', 'positive_count',
+                            'negative_count', 'neutral_count', 'sample_size')
+            }
+            stable['recent'] = [
+                (e.get('id'), e.get('content')) for e in trends.get('recent_emotions', [])
+            ]
+            trends_hash = hashlib.blake2b(
+                json.dumps(stable, sort_keys=True).encode()
+            ).digest()
+            if trends_hash == last_hash:
+                unchanged += 1
+                if unchanged >= UNCHANGED_CHECKS_BEFORE_BACKOFF:
+                    wait = max(min(wait * 2, MAX_INTERVAL), interval)
+                    unchanged = 0
+            else:
+                last_hash = trends_hash
+                unchanged = 0
+                wait = interval
+
             trend = trends.get('trend', 'neutral')
             avg_confidence = trends.get('average_confidence', 0.5)
             positive = trends.get('positive_count', 0)
@@ -59,9 +104,10 @@ def monitor_sentiment(client, continuous=False, interval=60):
             # Sentiment breakdown
             print(f"\n📈 Sentiment Breakdown:")
             if total > 0:
-                print(f"   Positive:  {positive:3d} ({positive/total*100:5.1f}%)")
-                print(f"   Negative:  {negative:3d} ({negative/total*100:5.1f}%)")
-                print(f"   Neutral:   {neutral:3d} ({neutral/total*100:5.1f}%)")
+                pct = 100.0 / total
+                print(f"   Positive:  {positive:3d} ({positive * pct:5.1f}%)")
+                print(f"   Negative:  {negative:3d} ({negative * pct:5.1f}%)")
+                print(f"   Neutral:   {neutral:3d} ({neutral * pct:5.1f}%)")
             else:
                 print(f"   No emotional data available")
 
@@ -69,27 +115,23 @@ def monitor_sentiment(client, continuous=False, interval=60):
             print(f"\n🕐 Recent Emotions (Last 5):")
             recent = trends.get('recent_emotions', [])
             if recent:
+                entries = []
                 for i, emotion in enumerate(recent, 1):
-                    sentiment = emotion.get('metadata', {}).get('sentiment', 'unknown')
-                    confidence = emotion.get('metadata', {}).get('confidence', 0.0)
-                    agent = emotion.get('metadata', {}).get('agent_name', 'unknown')
+                    meta = emotion.get('metadata') or {}
+                    sentiment = meta.get('sentiment', 'unknown')
+                    confidence = meta.get('confidence', 0.0)
+                    agent = meta.get('agent_name', 'unknown')
                     content = emotion.get('content', '')
 
                     # Extract feeling from content
-                    feeling_match = content.split('feels: ')
-                    feeling = feeling_match[1].split('\n')[0] if len(feeling_match) > 1 else content[:60]
+                    _, sep, rest = content.partition('feels: ')
+                    feeling = rest.partition('\n')[0] if sep else content[:60]
 
                     # Emoji based on sentiment
-                    emoji = {
-                        'positive': '😊',
-                        'confident': '💪',
-                        'negative': '😟',
-                        'frustrated': '😤',
-                        'neutral': '😐'
-                    }.get(sentiment, '🤔')
-
-                    print(f"\n   {i}. {emoji} [{agent}] Confidence: {confidence:.2f}")
-                    print(f"      \"{feeling}\"")
+                    emoji = _SENTIMENT_EMOJI.get(sentiment, '🤔')
+
+                    entries.append(_EMOTION_TEMPLATE.format(i, emoji, agent, confidence, feeling))
+                print("\n".join(entries))
             else:
                 print(f"   No recent emotions")
 
@@ -114,9 +156,9 @@ def monitor_sentiment(client, continuous=False, interval=60):
         if not continuous:
             break
 
-        print(f"\n⏳ Next check in {interval} seconds... (Ctrl+C to stop)")
+        print(f"\n⏳ Next check in {wait} seconds... (Ctrl+C to stop)")
         try:
-            time.sleep(interval)
+            time.sleep(wait)
         except KeyboardInterrupt:
             print(f"\n\n✓ Monitoring stopped")
             break
@@ -125,6 +167,10 @@ def main():
     """Main entry point"""
     import argparse
 
+    # Imported here so loading this module for monitor_sentiment() doesn't
+    # pull in requests and the rest of the client's dependencies
+    from openmemory_client import OpenMemoryClient
+
     parser = argparse.ArgumentParser(description='Monitor agent sentiment and confidence')
     parser.add_argument('--project', default='OpenMemory', help='Project name')
     parser.add_argument('--continuous', action='store_true', help='Run continuously')
@@ -134,28 +180,27 @@ def main():
     args = parser.parse_args()
 
     # Initialize client
-    client = OpenMemoryClient(
+    with OpenMemoryClient(
         base_url=args.base_url,
         project_name=args.project,
         user_id="ai-agent-system"
-    )
-
-    # Check health
-    health = client.health_check()
-    if not health.get("ok"):
-        print("❌ ERROR: OpenMemory server is not available")
-        print("Please start OpenMemory server first:")
-        print("  cd backend && npm run dev")
-        sys.exit(1)
-
-    print(f"✓ Connected to OpenMemory (v{health.get('version', 'unknown')})")
-
-    # Run monitoring
-    try:
-        monitor_sentiment(client, continuous=args.continuous, interval=args.interval)
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        sys.exit(1)
+    ) as client:
+        # Check health
+        health = client.health_check()
+        if not health.get("ok"):
+            print("❌ ERROR: OpenMemory server is not available")
+            print("Please start OpenMemory server first:")
+            print("  cd backend && npm run dev")
+            sys.exit(1)
+
+        print(f"✓ Connected to OpenMemory (v{health.get('version', 'unknown')})")
+
+        # Run monitoring
+        try:
+            monitor_sentiment(client, continuous=args.continuous, interval=args.interval)
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -4,9 +4,9 @@
 import sys
 sys.path.insert(0, '..')
 
-from openmemory_client import OpenMemoryClient
+from openmemory_client import get_client
 
-client = OpenMemoryClient(
+client = get_client(
     base_url="http://localhost:8080",
     project_name="OpenMemory",
     user_id="ai-agent-system"
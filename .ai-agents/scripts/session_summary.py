@@ -4,85 +4,81 @@
 import sys
 sys.path.insert(0, '..')
 
-from openmemory_client import OpenMemoryClient
+from openmemory_client import get_client
+from _findings_data import PATTERNS, DECISION_TITLES
 
-client = OpenMemoryClient(
+client = get_client(
     base_url="http://localhost:8080",
     project_name="OpenMemory",
     user_id="ai-agent-system"
 )
 
-print("=" * 70)
-print("           OpenMemory AI Agents Integration - Session Summary")
-print("=" * 70)
+# The report is collected and written in one go rather than line by line
+lines = []
+out = lines.append
+
+out("=" * 70)
+out("           OpenMemory AI Agents Integration - Session Summary")
+out("=" * 70)
 
 # Get full context
 context = client.get_full_context()
 
-print("\n[PROJECT STATUS]")
-print(f"  Mode: INITIALIZE -> Data successfully recorded")
-print(f"  Server: OpenMemory v2.0-hsg-tiered")
-print(f"  Embedding: synthetic (256 dimensions)")
-print(f"  Tier: hybrid")
-
-print("\n[MEMORIES STORED]")
-print(f"  State records: {len(context.get('state_history', []))}")
-print(f"  Actions: {len(context.get('actions', []))}")
-print(f"  Patterns: {len(context.get('patterns', []))}")
-print(f"  Decisions: {len(context.get('decisions', []))}")
-
-print("\n[CODING PATTERNS IDENTIFIED]")
-patterns = [
-    "1. Multi-Sector Memory Classification",
-    "2. Single-Waypoint Graph Linking",
-    "3. Composite Scoring for Memory Retrieval",
-    "4. Sector-Specific Memory Decay",
-    "5. AI Agent Activity Mapping"
-]
-for pattern in patterns:
-    print(f"  {pattern}")
-
-print("\n[ARCHITECTURAL DECISIONS RECORDED]")
-decisions = [
-    "1. HMD (Hierarchical Memory Decomposition) v2 Architecture",
-    "2. TypeScript Backend with Node.js Runtime",
-    "3. SQLite Primary Storage with PostgreSQL Option",
-    "4. Multi-Provider Embedding Support (OpenAI/Gemini/Ollama/local/synthetic)",
-    "5. Express.js REST API Framework"
-]
-for decision in decisions:
-    print(f"  {decision}")
-
-print("\n[KEY FINDINGS]")
-print("  Architecture:")
-print("    - 5 Memory Sectors: episodic, semantic, procedural, emotional, reflective")
-print("    - Composite scoring: 60% similarity + 20% salience + 10% recency + 10% waypoint")
-print("    - Single-waypoint graph linking (similarity >= 0.75)")
-print("    - Sector-specific decay rates (0.001 to 0.020)")
-print("\n  AI Agents Integration:")
-print("    - 10 specialized endpoints at /ai-agents/*")
-print("    - State -> semantic, Actions -> episodic, Patterns -> procedural, Decisions -> reflective")
-print("    - Python client library at .ai-agents/openmemory_client.py")
-print("\n  Performance:")
-print("    - 115ms average response time (100k nodes)")
-print("    - 338 QPS throughput")
-print("    - 95% recall accuracy")
-print("    - 7.9ms/item scalability")
-
-print("\n[FILES CREATED]")
-print("  - load_context.py: Load project context from OpenMemory")
-print("  - record_action.py: Record actions in OpenMemory")
-print("  - store_findings.py: Store patterns and decisions")
-print("  - save_state.py: Save project state")
-print("  - verify_storage.py: Verify memory storage")
-print("  - session_summary.py: This summary")
-
-print("\n[NEXT STEPS]")
-print("  - All project context is now stored in OpenMemory")
-print("  - Future sessions will detect RESUME mode")
-print("  - Use client.get_full_context() to load everything")
-print("  - Query specific patterns/decisions with client.query_memories()")
-print("  - Record new actions as development continues")
+out("\n[PROJECT STATUS]")
+out(f"  Mode: INITIALIZE -> Data successfully recorded")
+out(f"  Server: OpenMemory v2.0-hsg-tiered")
+out(f"  Embedding: synthetic (256 dimensions)")
+out(f"  Tier: hybrid")
+
+out("\n[MEMORIES STORED]")
+out(f"  State records: {1 if context.get('state') else 0}")
+out(f"  Actions: {len(context.get('recent_actions', []))}")
+out(f"  Patterns: {len(context.get('patterns', []))}")
+out(f"  Decisions: {len(context.get('decisions', []))}")
+
+out("\n[CODING PATTERNS IDENTIFIED]")
+for i, pattern in enumerate(PATTERNS, 1):
+    out(f"  {i}. {pattern['pattern_name']}")
+
+out("\n[ARCHITECTURAL DECISIONS RECORDED]")
+for i, title in enumerate(DECISION_TITLES, 1):
+    out(f"  {i}. {title}")
+
+out("\n[KEY FINDINGS]")
+out("  Architecture:")
+out("    - 5 Memory Sectors: episodic, semantic, procedural, emotional, reflective")
+out("    - Composite scoring: 60% similarity + 20% salience + 10% recency + 10% waypoint")
+out("    - Single-waypoint graph linking (similarity >= 0.75)")
+out("    - Sector-specific decay rates (0.001 to 0.020)")
+out("\n  AI Agents Integration:")
+out("    - 10 specialized endpoints at /ai-agents/*")
+out("    - State -> semantic, Actions -> episodic, Patterns -> procedural, Decisions -> reflective")
+out("    - Python client library at .ai-agents/openmemory_client.py")
+out("\n  Performance:")
+out("    - 115ms average response time (100k nodes)")
+out("    - 338 QPS throughput")
+out("    - 95% recall accuracy")
+out("    - 7.9ms/item scalability")
+
+out("\n[FILES CREATED]")
+out("  - load_context.py: Load project context from OpenMemory")
+out("  - record_action.py: Record actions in OpenMemory")
+out("  - store_findings.py: Store patterns and decisions")
+out("  - save_state.py: Save project state")
+out("  - verify_storage.py: Verify memory storage")
+out("  - session_summary.py: This summary")
+
+out("\n[NEXT STEPS]")
+out("  - All project context is now stored in OpenMemory")
+out("  - Future sessions will detect RESUME mode")
+out("  - Use client.get_full_context() to load everything")
+out("  - Query specific patterns/decisions with client.query_memories()")
+out("  - Record new actions as development continues")
+
+# Emit the report before recording the action so it isn't lost if that fails
+sys.stdout.write("\n".join(lines) + "\n")
+sys.stdout.flush()
+lines.clear()
 
 # Record final action
 result = client.record_action(
@@ -92,9 +88,11 @@
     outcome="SUCCESS: All findings stored in OpenMemory. System ready for continued development with full context persistence."
 )
 
-print(f"\n[SESSION COMPLETE]")
-print(f"  Final action recorded: {result.get('memory_id')[:8]}...")
-print(f"  All memories are persistent and searchable")
-print(f"  Ready for next development session")
+out(f"\n[SESSION COMPLETE]")
+out(f"  Final action recorded: {result.get('memory_id')[:8]}...")
+out(f"  All memories are persistent and searchable")
+out(f"  Ready for next development session")
+
+out("\n" + "=" * 70)
 
-print("\n" + "=" * 70)
+sys.stdout.write("\n".join(lines) + "\n")
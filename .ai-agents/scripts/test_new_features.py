@@ -8,13 +8,15 @@
 sys.path.insert(0, '..')
 
 from openmemory_client import OpenMemoryClient
+from concurrent.futures import ThreadPoolExecutor
+import io
 import json
 
-def test_emotional_memory(client):
+def test_emotional_memory(client, log=print):
     """Test emotional memory integration"""
-    print("\n" + "="*60)
-    print("TESTING EMOTIONAL MEMORY")
-    print("="*60)
+    log("\n" + "="*60)
+    log("TESTING EMOTIONAL MEMORY")
+    log("="*60)
 
     # Record various emotions
     emotions = [
@@ -41,32 +43,37 @@ def test_emotional_memory(client):
         },
     ]
 
-    for emo in emotions:
-        result = client.record_emotion(**emo)
-        print(f"✓ Recorded: {emo['feeling'][:50]}... (ID: {result['memory_id']})")
+    # Independent writes, so send them together
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda emo: client.record_emotion(**emo), emotions))
+    for emo, result in zip(emotions, results):
+        log(f"✓ Recorded: {emo['feeling'][:50]}... (ID: {result['memory_id']})")
 
     # Get emotional timeline
-    print("\n--- Emotional Timeline ---")
+    log("\n--- Emotional Timeline ---")
     timeline = client.get_emotional_timeline(limit=10)
+    lines = []
     for i, emotion in enumerate(timeline, 1):
-        sentiment = emotion.get('metadata', {}).get('sentiment', 'unknown')
-        confidence = emotion.get('metadata', {}).get('confidence', 0.0)
+        meta = emotion.get('metadata') or {}
+        sentiment = meta.get('sentiment', 'unknown').upper()
+        confidence = meta.get('confidence', 0.0)
         content = emotion.get('content', '')[:60]
-        print(f"{i}. [{sentiment.upper()}] Confidence: {confidence:.2f}")
-        print(f"   {content}...")
+        lines.append(f"{i}. [{sentiment}] Confidence: {confidence:.2f}\n   {content}...")
+    if lines:
+        log("\n".join(lines))
 
     # Analyze sentiment trends
-    print("\n--- Sentiment Analysis ---")
+    log("\n--- Sentiment Analysis ---")
     trends = client.analyze_sentiment_trends()
-    print(f"Overall Trend: {trends.get('trend', 'unknown').upper()}")
-    print(f"Average Confidence: {trends.get('average_confidence', 0.0):.2f}")
-    print(f"Positive: {trends.get('positive_count', 0)}, Negative: {trends.get('negative_count', 0)}, Neutral: {trends.get('neutral_count', 0)}")
+    log(f"Overall Trend: {trends.get('trend', 'unknown').upper()}")
+    log(f"Average Confidence: {trends.get('average_confidence', 0.0):.2f}")
+    log(f"Positive: {trends.get('positive_count', 0)}, Negative: {trends.get('negative_count', 0)}, Neutral: {trends.get('neutral_count', 0)}")
 
-def test_waypoint_graphs(client):
+def test_waypoint_graphs(client, log=print):
     """Test waypoint graph integration"""
-    print("\n" + "="*60)
-    print("TESTING WAYPOINT GRAPHS")
-    print("="*60)
+    log("\n" + "="*60)
+    log("TESTING WAYPOINT GRAPHS")
+    log("="*60)
 
     # Create a decision
     decision = client.record_decision(
@@ -76,7 +83,7 @@ def test_waypoint_graphs(client):
         consequences="Requires separate database server"
     )
     decision_id = decision['memory_id']
-    print(f"✓ Created decision: {decision_id}")
+    log(f"✓ Created decision: {decision_id}")
 
     # Create a pattern that implements the decision
     pattern = client.store_pattern(
@@ -85,7 +92,7 @@ def test_waypoint_graphs(client):
         example="const pool = new Pool({ host, port, database, user, password, max: 20 })"
     )
     pattern_id = pattern['memory_id']
-    print(f"✓ Created pattern: {pattern_id}")
+    log(f"✓ Created pattern: {pattern_id}")
 
     # Link decision → pattern
     link1 = client.link_memories(
@@ -94,7 +101,7 @@ def test_waypoint_graphs(client):
         weight=0.90,
         relationship="led_to"
     )
-    print(f"✓ Linked: decision → pattern (weight: 0.90)")
+    log(f"✓ Linked: decision → pattern (weight: 0.90)")
 
     # Record actions that use the pattern
     action1 = client.record_action(
@@ -106,36 +113,42 @@ def test_waypoint_graphs(client):
         used_pattern=pattern_id
     )
     action1_id = action1['memory_id']
-    print(f"✓ Created action with auto-links: {action1_id}")
-    print(f"  Links: {action1.get('links', {})}")
+    log(f"✓ Created action with auto-links: {action1_id}")
+    log(f"  Links: {action1.get('links', {})}")
 
     # Get the memory graph
-    print("\n--- Memory Graph Traversal ---")
+    log("\n--- Memory Graph Traversal ---")
     graph = client.get_memory_graph(decision_id, depth=3)
-    print(f"Root: {decision_id}")
-    print(f"Total waypoints: {graph.get('count', 0)}")
+    log(f"Root: {decision_id}")
+    log(f"Total waypoints: {graph.get('count', 0)}")
 
     waypoints = graph.get('waypoints', [])
+    lines = []
     for wp in waypoints[:5]:  # Show first 5
         depth = wp.get('depth', 0)
         content = wp.get('content', '')[:50]
         sector = wp.get('primary_sector', 'unknown')
-        print(f"  {'  ' * depth}→ [{sector}] {content}...")
+        lines.append(f"  {'  ' * depth}→ [{sector}] {content}...")
+    if lines:
+        log("\n".join(lines))
 
     # Trace decision to actions
-    print("\n--- Decision Trace ---")
+    log("\n--- Decision Trace ---")
     chain = client.trace_decision_to_actions(decision_id)
-    print(f"Full chain from decision to outcomes:")
+    log(f"Full chain from decision to outcomes:")
+    lines = []
     for item in chain[:5]:
         sector = item.get('primary_sector', 'unknown')
         content = item.get('content', '')[:60]
-        print(f"  • [{sector}] {content}...")
+        lines.append(f"  • [{sector}] {content}...")
+    if lines:
+        log("\n".join(lines))
 
-def test_pattern_detection(client):
+def test_pattern_detection(client, log=print):
     """Test automatic pattern detection"""
-    print("\n" + "="*60)
-    print("TESTING AUTOMATIC PATTERN DETECTION")
-    print("="*60)
+    log("\n" + "="*60)
+    log("TESTING AUTOMATIC PATTERN DETECTION")
+    log("="*60)
 
     # Record some repeated action sequences
     sequences = [
@@ -151,35 +164,38 @@ def test_pattern_detection(client):
         ["Created React component", "Added TypeScript types", "Wrote unit tests"],
     ]
 
-    print("Recording action sequences...")
-    for seq in sequences:
-        for action in seq:
-            client.record_action(
-                agent_name="full_stack_developer",
-                action=action,
-                context="Building application features",
-                outcome="success"
-            )
-    print(f"✓ Recorded {sum(len(s) for s in sequences)} actions")
+    log("Recording action sequences...")
+    actions = [
+        {
+            "agent_name": "full_stack_developer",
+            "action": action,
+            "context": "Building application features",
+            "outcome": "success",
+        }
+        for seq in sequences
+        for action in seq
+    ]
+    client.record_actions_batch(actions)
+    log(f"✓ Recorded {len(actions)} actions")
 
     # Run pattern detection
-    print("\n--- Running Pattern Detection ---")
+    log("\n--- Running Pattern Detection ---")
     detected = client.detect_patterns(
         lookback_days=7,
         min_frequency=3
     )
 
-    print(f"Detected {len(detected)} patterns:")
+    log(f"Detected {len(detected)} patterns:")
     for pattern in detected:
-        print(f"\n✓ {pattern['pattern_name']}")
-        print(f"  Frequency: {pattern['frequency']} times")
-        print(f"  Memory ID: {pattern['memory_id']}")
+        log(f"\n✓ {pattern['pattern_name']}")
+        log(f"  Frequency: {pattern['frequency']} times")
+        log(f"  Memory ID: {pattern['memory_id']}")
 
-def test_smart_reinforcement(client):
+def test_smart_reinforcement(client, log=print):
     """Test smart reinforcement and importance scoring"""
-    print("\n" + "="*60)
-    print("TESTING SMART REINFORCEMENT")
-    print("="*60)
+    log("\n" + "="*60)
+    log("TESTING SMART REINFORCEMENT")
+    log("="*60)
 
     # Create a successful pattern
     pattern = client.store_pattern(
@@ -188,90 +204,120 @@ def test_smart_reinforcement(client):
         example="app.use((err, req, res, next) => { res.status(500).json({ error: err.message }) })"
     )
     pattern_id = pattern['memory_id']
-    print(f"✓ Created pattern: {pattern_id}")
+    log(f"✓ Created pattern: {pattern_id}")
 
     # Get initial metrics
-    print("\n--- Initial Metrics ---")
+    log("\n--- Initial Metrics ---")
     metrics = client.get_memory_metrics(pattern_id)
-    print(f"Salience: {metrics['salience']}")
-    print(f"Coactivations: {metrics['coactivations']}")
-    print(f"Importance Score: {metrics['importance_score']}")
-    print(f"Tier: {metrics['tier']}")
+    log(f"Salience: {metrics['salience']}")
+    log(f"Coactivations: {metrics['coactivations']}")
+    log(f"Importance Score: {metrics['importance_score']}")
+    log(f"Tier: {metrics['tier']}")
 
     # Reinforce based on success
-    print("\n--- Reinforcing Memory ---")
+    log("\n--- Reinforcing Memory ---")
     reinforce1 = client.reinforce_memory_smart(pattern_id, reason="success")
-    print(f"✓ Reinforced (success): boost = {reinforce1['boost']}")
+    log(f"✓ Reinforced (success): boost = {reinforce1['boost']}")
 
     reinforce2 = client.reinforce_memory_smart(pattern_id, reason="frequent_use")
-    print(f"✓ Reinforced (frequent_use): boost = {reinforce2['boost']}")
+    log(f"✓ Reinforced (frequent_use): boost = {reinforce2['boost']}")
 
     reinforce3 = client.reinforce_memory_smart(pattern_id, reason="success")
-    print(f"✓ Reinforced (success): boost = {reinforce3['boost']}")
+    log(f"✓ Reinforced (success): boost = {reinforce3['boost']}")
 
     # Get updated metrics
-    print("\n--- Updated Metrics ---")
+    log("\n--- Updated Metrics ---")
     metrics2 = client.get_memory_metrics(pattern_id)
-    print(f"Salience: {metrics2['salience']} (was {metrics['salience']})")
-    print(f"Coactivations: {metrics2['coactivations']} (was {metrics['coactivations']})")
-    print(f"Importance Score: {metrics2['importance_score']} (was {metrics['importance_score']})")
-    print(f"Tier: {metrics2['tier']}")
+    log(f"Salience: {metrics2['salience']} (was {metrics['salience']})")
+    log(f"Coactivations: {metrics2['coactivations']} (was {metrics['coactivations']})")
+    log(f"Importance Score: {metrics2['importance_score']} (was {metrics['importance_score']})")
+    log(f"Tier: {metrics2['tier']}")
 
     # Get most important memories
-    print("\n--- Most Important Memories ---")
+    log("\n--- Most Important Memories ---")
     important = client.get_most_important_memories(
         memory_type="patterns",
         limit=5
     )
-    print(f"Top {len(important)} patterns by importance:")
+    log(f"Top {len(important)} patterns by importance:")
+    lines = []
     for i, mem in enumerate(important, 1):
         score = mem.get('importance_score', 0.0)
         content = mem.get('content', '')[:50]
         coacts = mem.get('coactivations', 0)
-        print(f"{i}. Score: {score:.2f}, Coactivations: {coacts}")
-        print(f"   {content}...")
+        lines.append(f"{i}. Score: {score:.2f}, Coactivations: {coacts}\n   {content}...")
+    if lines:
+        log("\n".join(lines))
+
+def buffered_log():
+    """A print-alike that collects output, so a test run on a worker thread prints in one piece"""
+    buf = io.StringIO()
+
+    def log(*args, **kwargs):
+        print(*args, file=buf, **kwargs)
+
+    return log, buf
+
+def quiet_log(*args, **kwargs):
+    """Stand-in for log when --verbose is off"""
 
 def main():
     """Run all tests"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Test deep integration features')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Print the output of each test')
+    args = parser.parse_args()
+
     print("="*60)
     print("DEEP INTEGRATION FEATURE TESTS")
     print("="*60)
 
     # Initialize client
-    client = OpenMemoryClient(
+    with OpenMemoryClient(
         base_url="http://localhost:8080",
         project_name="DeepIntegrationTest",
         user_id="ai-agent-system"
-    )
-
-    # Check health
-    health = client.health_check()
-    if not health.get("ok"):
-        print("ERROR: OpenMemory server is not available")
-        print("Please start OpenMemory server first:")
-        print("  cd backend && npm run dev")
-        sys.exit(1)
-
-    print(f"✓ Connected to OpenMemory (v{health.get('version', 'unknown')})")
-    print(f"  Tier: {health.get('tier')}")
-    print(f"  Embedding: {health.get('embedding', {}).get('provider')}")
-
-    try:
-        # Run all tests
-        test_emotional_memory(client)
-        test_waypoint_graphs(client)
-        test_pattern_detection(client)
-        test_smart_reinforcement(client)
-
-        print("\n" + "="*60)
-        print("ALL TESTS COMPLETED SUCCESSFULLY!")
-        print("="*60)
-
-    except Exception as e:
-        print(f"\n❌ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    ) as client:
+        # Check health
+        health = client.health_check()
+        if not health.get("ok"):
+            print("ERROR: OpenMemory server is not available")
+            print("Please start OpenMemory server first:")
+            print("  cd backend && npm run dev")
+            sys.exit(1)
+
+        print(f"✓ Connected to OpenMemory (v{health.get('version', 'unknown')})")
+        print(f"  Tier: {health.get('tier')}")
+        print(f"  Embedding: {health.get('embedding', {}).get('provider')}")
+
+        try:
+            # The waypoint test records an action, so it runs on its own
+            # first; otherwise that action could land inside the sequences
+            # pattern detection is looking for
+            test_waypoint_graphs(client, print if args.verbose else quiet_log)
+
+            # The rest share no data, so run them side by side and print
+            # each one's output in turn
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                runs = []
+                for test in (test_emotional_memory, test_pattern_detection, test_smart_reinforcement):
+                    log, buf = buffered_log() if args.verbose else (quiet_log, None)
+                    runs.append((pool.submit(test, client, log), buf))
+                for future, buf in runs:
+                    future.result()
+                    if buf is not None:
+                        sys.stdout.write(buf.getvalue())
+
+            print("\n" + "="*60)
+            print("ALL TESTS COMPLETED SUCCESSFULLY!")
+            print("="*60)
+
+        except Exception as e:
+            print(f"\n❌ ERROR: {e}")
+            import traceback
+            traceback.print_exc()
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -4,10 +4,24 @@
 import sys
 sys.path.insert(0, '..')
 
-from openmemory_client import OpenMemoryClient
+from openmemory_client import get_client
 import json
 
-client = OpenMemoryClient(
+
+def show_records(heading, noun, records, preview_len):
+    """Write one section of query results to stdout in a single write"""
+    lines = [heading, f"Found {len(records)} {noun}"]
+    for i, record in enumerate(records, 1):
+        preview = record.get('content', 'N/A')[:preview_len]
+        lines.append(f"\n{i}. ID: {record.get('id', 'unknown')[:8]}...")
+        lines.append(f"   Content preview: {preview}...")
+        metadata = record.get('metadata')
+        if metadata:
+            lines.append(f"   Metadata: {json.dumps(metadata)}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+client = get_client(
     base_url="http://localhost:8080",
     project_name="OpenMemory",
     user_id="ai-agent-system"
@@ -15,60 +29,17 @@
 
 print("=== Querying Stored Memories ===\n")
 
-# Query for patterns
-print("--- Coding Patterns ---")
-patterns = client.query_memories(
-    query="coding patterns architecture memory",
-    memory_type="patterns",
-    k=5
-)
-print(f"Found {len(patterns)} patterns")
-for i, p in enumerate(patterns, 1):
-    print(f"\n{i}. ID: {p.get('id', 'unknown')[:8]}...")
-    print(f"   Content preview: {p.get('content', 'N/A')[:150]}...")
-    if p.get('metadata'):
-        print(f"   Metadata: {json.dumps(p.get('metadata'), indent=6)}")
-
-# Query for decisions
-print("\n\n--- Architectural Decisions ---")
-decisions = client.query_memories(
-    query="architectural decisions OpenMemory",
-    memory_type="decisions",
-    k=5
-)
-print(f"Found {len(decisions)} decisions")
-for i, d in enumerate(decisions, 1):
-    print(f"\n{i}. ID: {d.get('id', 'unknown')[:8]}...")
-    print(f"   Content preview: {d.get('content', 'N/A')[:150]}...")
-    if d.get('metadata'):
-        print(f"   Metadata: {json.dumps(d.get('metadata'), indent=6)}")
-
-# Query for actions
-print("\n\n--- Agent Actions ---")
-actions = client.query_memories(
-    query="claude-code actions OpenMemory",
-    memory_type="actions",
-    k=5
-)
-print(f"Found {len(actions)} actions")
-for i, a in enumerate(actions, 1):
-    print(f"\n{i}. ID: {a.get('id', 'unknown')[:8]}...")
-    print(f"   Content preview: {a.get('content', 'N/A')[:200]}...")
-    if a.get('metadata'):
-        print(f"   Metadata: {json.dumps(a.get('metadata'), indent=6)}")
-
-# Query for project state
-print("\n\n--- Project State ---")
-state = client.query_memories(
-    query="OpenMemory project state version architecture",
-    memory_type="state",
-    k=1
-)
-print(f"Found {len(state)} state records")
-for i, s in enumerate(state, 1):
-    print(f"\n{i}. ID: {s.get('id', 'unknown')[:8]}...")
-    print(f"   Content preview: {s.get('content', 'N/A')[:300]}...")
-    if s.get('metadata'):
-        print(f"   Metadata: {json.dumps(s.get('metadata'), indent=6)}")
+# All four queries go to the server in one request
+patterns, decisions, actions, state = client.query_memories_batch([
+    {"query": "coding patterns architecture memory", "memory_type": "patterns", "k": 5},
+    {"query": "architectural decisions OpenMemory", "memory_type": "decisions", "k": 5},
+    {"query": "claude-code actions OpenMemory", "memory_type": "actions", "k": 5},
+    {"query": "OpenMemory project state version architecture", "memory_type": "state", "k": 1},
+])
+
+show_records("--- Coding Patterns ---", "patterns", patterns, 150)
+show_records("\n\n--- Architectural Decisions ---", "decisions", decisions, 150)
+show_records("\n\n--- Agent Actions ---", "actions", actions, 200)
+show_records("\n\n--- Project State ---", "state records", state, 300)
 
 print("\n\n=== Verification Complete ===")
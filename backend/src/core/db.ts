@@ -54,6 +54,27 @@ let memories_table: string
 
 const is_pg = env.metadata_backend === 'postgres'
 
+// Both backends have a single transaction slot, so concurrent requests queue
+// here in begin() instead of failing on a nested BEGIN
+const tx_gate = () => {
+    let tail = Promise.resolve()
+    let release = () => { }
+    return {
+        enter: async () => {
+            const prev = tail
+            let done!: () => void
+            tail = new Promise<void>(ok => { done = ok })
+            await prev
+            release = done
+        },
+        leave: () => {
+            const r = release
+            release = () => { }
+            r()
+        }
+    }
+}
+
 if (is_pg) {
     const ssl = process.env.OM_PG_SSL === 'require' ? { rejectUnauthorized: false } : process.env.OM_PG_SSL === 'disable' ? false : undefined
     const db_name = process.env.OM_PG_DB || 'openmemory'
@@ -81,19 +102,27 @@ if (is_pg) {
     run_async = async (sql, p = []) => { await exec(sql, p) }
     get_async = async (sql, p = []) => (await exec(sql, p))[0]
     all_async = async (sql, p = []) => await exec(sql, p)
+    const gate = tx_gate()
     transaction = {
         begin: async () => {
-            if (cli) throw new Error('transaction active')
-            cli = await pg.connect()
-            await cli.query('BEGIN')
+            await gate.enter()
+            try {
+                cli = await pg.connect()
+                await cli.query('BEGIN')
+            } catch (e) {
+                cli?.release()
+                cli = null
+                gate.leave()
+                throw e
+            }
         },
         commit: async () => {
             if (!cli) return
-            try { await cli.query('COMMIT') } finally { cli.release(); cli = null }
+            try { await cli.query('COMMIT') } finally { cli.release(); cli = null; gate.leave() }
         },
         rollback: async () => {
             if (!cli) return
-            try { await cli.query('ROLLBACK') } finally { cli.release(); cli = null }
+            try { await cli.query('ROLLBACK') } finally { cli.release(); cli = null; gate.leave() }
         }
     }
     let ready = false
@@ -226,10 +255,15 @@ if (is_pg) {
     run_async = exec
     get_async = one
     all_async = many
+    const gate = tx_gate()
     transaction = {
-        begin: () => exec('BEGIN TRANSACTION'),
-        commit: () => exec('COMMIT'),
-        rollback: () => exec('ROLLBACK')
+        begin: async () => {
+            await gate.enter()
+            try { await exec('BEGIN TRANSACTION') } catch (e) { gate.leave(); throw e }
+        },
+        // A failed COMMIT leaves the transaction open for the caller's rollback
+        commit: async () => { await exec('COMMIT'); gate.leave() },
+        rollback: async () => { try { await exec('ROLLBACK') } finally { gate.leave() } }
     }
     q = {
         ins_mem: { run: (...p) => exec('insert into memories(id,user_id,segment,content,simhash,primary_sector,tags,meta,created_at,updated_at,last_seen_at,salience,decay_lambda,version,mean_dim,mean_vec,compressed_vec,feedback_score) values(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)', p) },
@@ -5,6 +5,7 @@
  * Stores project state, agent context, development history, and patterns in OpenMemory
  */
 
+import { createHash } from 'crypto';
 import { add_hsg_memory, hsg_query, reinforce_memory } from '../../memory/hsg';
 import { now, j } from '../../utils';
 import { run_async, q, all_async, get_async } from '../../core/db';
@@ -107,62 +108,11 @@ export function aiagents(app: any) {
    */
   app.post('/ai-agents/action', async (req: any, res: any) => {
     try {
-      const {
-        project_name,
-        agent_name,
-        action,
-        context,
-        outcome,
-        related_decision,  // NEW: decision memory ID that led to this action
-        used_pattern,      // NEW: pattern memory ID used in this action
-        user_id = 'ai-agent-system',
-      } = req.body;
-
-      if (!project_name || !agent_name || !action) {
-        return res.status(400).json({ err: 'project_name, agent_name, and action required' });
-      }
-
-      const content = `Agent ${agent_name} performed: ${action}\nContext: ${context || 'N/A'}\nOutcome: ${outcome || 'pending'}`;
-      const tags = j(['agent-action', project_name, agent_name]);
-      const metadata = {
-        project_name,
-        agent_name,
-        action,
-        context,
-        outcome,
-        related_decision,
-        used_pattern,
-        timestamp: new Date().toISOString(),
-        sector: 'episodic',
-      };
-
-      const result = await add_hsg_memory(content, tags, metadata, user_id);
-
-      // NEW: Automatically create waypoints for linked memories
-      const links: any = { decision: null, pattern: null };
-      if (related_decision) {
-        await run_async(
-          `INSERT OR REPLACE INTO waypoints (src_id, dst_id, weight, created_at, updated_at)
-           VALUES (?, ?, ?, ?, ?)`,
-          [related_decision, result.id, 0.85, Date.now(), Date.now()]
-        );
-        links.decision = related_decision;
+      const out = await recordAction(req.body);
+      if (out.err) {
+        return res.status(400).json(out);
       }
-      if (used_pattern) {
-        await run_async(
-          `INSERT OR REPLACE INTO waypoints (src_id, dst_id, weight, created_at, updated_at)
-           VALUES (?, ?, ?, ?, ?)`,
-          [used_pattern, result.id, 0.75, Date.now(), Date.now()]
-        );
-        links.pattern = used_pattern;
-      }
-
-      res.json({
-        success: true,
-        memory_id: result.id,
-        message: 'Agent action recorded' + (related_decision || used_pattern ? ' with links' : ''),
-        links,
-      });
+      res.json(out);
     } catch (error: any) {
       console.error('[ai-agents] Error storing agent action:', error);
       res.status(500).json({ err: error.message });
@@ -175,35 +125,11 @@ export function aiagents(app: any) {
    */
   app.post('/ai-agents/pattern', async (req: any, res: any) => {
     try {
-      const {
-        project_name,
-        pattern_name,
-        description,
-        example,
-        tags: userTags = [],
-        user_id = 'ai-agent-system',
-      } = req.body;
-
-      if (!project_name || !pattern_name || !description) {
-        return res.status(400).json({ err: 'project_name, pattern_name, and description required' });
+      const out = await storePattern(req.body);
+      if (out.err) {
+        return res.status(400).json(out);
       }
-
-      const content = `Pattern: ${pattern_name}\n${description}${example ? `\n\nExample:\n${example}` : ''}`;
-      const tags = j(['coding-pattern', project_name, ...userTags]);
-      const metadata = {
-        project_name,
-        pattern_name,
-        timestamp: new Date().toISOString(),
-        sector: 'procedural',
-      };
-
-      const result = await add_hsg_memory(content, tags, metadata, user_id);
-
-      res.json({
-        success: true,
-        memory_id: result.id,
-        message: 'Coding pattern stored',
-      });
+      res.json(out);
     } catch (error: any) {
       console.error('[ai-agents] Error storing pattern:', error);
       res.status(500).json({ err: error.message });
@@ -216,37 +142,11 @@ export function aiagents(app: any) {
    */
   app.post('/ai-agents/decision', async (req: any, res: any) => {
     try {
-      const {
-        project_name,
-        decision,
-        rationale,
-        alternatives,
-        consequences,
-        user_id = 'ai-agent-system',
-      } = req.body;
-
-      if (!project_name || !decision || !rationale) {
-        return res.status(400).json({ err: 'project_name, decision, and rationale required' });
+      const out = await recordDecision(req.body);
+      if (out.err) {
+        return res.status(400).json(out);
       }
-
-      const content = `Decision: ${decision}\n\nRationale: ${rationale}${
-        alternatives ? `\n\nAlternatives considered: ${alternatives}` : ''
-      }${consequences ? `\n\nConsequences: ${consequences}` : ''}`;
-      const tags = j(['architectural-decision', project_name]);
-      const metadata = {
-        project_name,
-        decision,
-        timestamp: new Date().toISOString(),
-        sector: 'reflective',
-      };
-
-      const result = await add_hsg_memory(content, tags, metadata, user_id);
-
-      res.json({
-        success: true,
-        memory_id: result.id,
-        message: 'Architectural decision recorded',
-      });
+      res.json(out);
     } catch (error: any) {
       console.error('[ai-agents] Error storing decision:', error);
       res.status(500).json({ err: error.message });
@@ -259,31 +159,48 @@ export function aiagents(app: any) {
    */
   app.post('/ai-agents/query', async (req: any, res: any) => {
     try {
-      const {
-        project_name,
-        query,
-        memory_type = 'all',
-        k = 10,
-        user_id = 'ai-agent-system',
-      } = req.body;
+      const out = await queryMemories(req.body);
+      if (out.err) {
+        return res.status(400).json(out);
+      }
+      res.json(out);
+    } catch (error: any) {
+      console.error('[ai-agents] Error querying project memories:', error);
+      res.status(500).json({ err: error.message });
+    }
+  });
+
+  /**
+   * Run several project memory queries in one request
+   * POST /ai-agents/query-batch
+   * Body: { project_name, user_id?, queries: [{ query, memory_type?, k? }] }
+   */
+  app.post('/ai-agents/query-batch', async (req: any, res: any) => {
+    try {
+      const { project_name, user_id, queries } = req.body;
 
-      if (!project_name || !query) {
-        return res.status(400).json({ err: 'project_name and query required' });
+      if (!Array.isArray(queries)) {
+        return res.status(400).json({ err: 'queries array required' });
       }
 
-      const sectorMap: Record<string, string[]> = {
-        state: ['semantic'],
-        actions: ['episodic'],
-        patterns: ['procedural'],
-        decisions: ['reflective'],
-        all: ['semantic', 'episodic', 'procedural', 'reflective'],
+      // Queries only read, so a few run side by side; hsg_query rejects
+      // anything past env.max_active, so a large batch must not start them
+      // all at once. Each gets the body /ai-agents/query would return, or { err }
+      const results: any[] = new Array(queries.length);
+      let next = 0;
+      const worker = async () => {
+        while (next < queries.length) {
+          const index = next++;
+          try {
+            results[index] = await queryMemories({ project_name, user_id, ...queries[index] });
+          } catch (error: any) {
+            results[index] = { err: error.message };
+          }
+        }
       };
-
-      const sectors = sectorMap[memory_type] || sectorMap.all;
-      const results = await hsg_query(query, k, {
-        sectors,
-        user_id
-      });
+      await Promise.all(
+        Array.from({ length: Math.min(QUERY_BATCH_CONCURRENCY, queries.length) }, worker)
+      );
 
       res.json({
         success: true,
@@ -291,7 +208,7 @@ export function aiagents(app: any) {
         count: results.length,
       });
     } catch (error: any) {
-      console.error('[ai-agents] Error querying project memories:', error);
+      console.error('[ai-agents] Error running query batch:', error);
       res.status(500).json({ err: error.message });
     }
   });
@@ -483,51 +400,53 @@ export function aiagents(app: any) {
    */
   app.post('/ai-agents/emotion', async (req: any, res: any) => {
     try {
-      const {
-        project_name,
-        agent_name,
-        context,
-        sentiment,      // positive, negative, neutral, frustrated, confident
-        confidence,     // 0.0 - 1.0
-        feeling,        // "This feels right", "Stuck on this", "Very confident"
-        related_action, // Optional: link to action ID
-        user_id = 'ai-agent-system',
-      } = req.body;
-
-      if (!project_name || !agent_name || !feeling) {
-        return res.status(400).json({ err: 'project_name, agent_name, and feeling required' });
+      const out = await recordEmotion(req.body);
+      if (out.err) {
+        return res.status(400).json(out);
       }
+      res.json(out);
+    } catch (error: any) {
+      console.error('[ai-agents] Error storing emotion:', error);
+      res.status(500).json({ err: error.message });
+    }
+  });
 
-      const content = `Agent ${agent_name} feels: ${feeling}\nContext: ${context || 'N/A'}\nSentiment: ${sentiment || 'neutral'}\nConfidence: ${confidence !== undefined ? confidence : 0.5}`;
-      const tags = j(['agent-emotion', project_name, agent_name, sentiment || 'neutral']);
-      const metadata = {
-        project_name,
-        agent_name,
-        sentiment: sentiment || 'neutral',
-        confidence: confidence !== undefined ? confidence : 0.5,
-        related_action,
-        timestamp: new Date().toISOString(),
-        sector: 'emotional',
-      };
+  /**
+   * Store several writes in one request
+   * POST /ai-agents/batch
+   * Body: { items: [{ type: 'action' | 'emotion' | 'pattern' | 'decision', ...fields }] }
+   * Results come back in item order; a failed item gets { err } instead of failing the batch.
+   */
+  app.post('/ai-agents/batch', async (req: any, res: any) => {
+    try {
+      const { items } = req.body;
 
-      const result = await add_hsg_memory(content, tags, metadata, user_id);
+      if (!Array.isArray(items)) {
+        return res.status(400).json({ err: 'items array required' });
+      }
 
-      // Link to related action if provided
-      if (related_action) {
-        await run_async(
-          `INSERT OR REPLACE INTO waypoints (src_id, dst_id, weight, created_at, updated_at)
-           VALUES (?, ?, ?, ?, ?)`,
-          [related_action, result.id, 0.70, Date.now(), Date.now()]
-        );
+      // Stored one after another: add_hsg_memory runs its own transaction per memory
+      const results: any[] = [];
+      for (const item of items) {
+        const write = batchWriters[item?.type];
+        if (!write) {
+          results.push({ err: `unknown item type: ${item?.type}` });
+          continue;
+        }
+        try {
+          results.push(await write(item));
+        } catch (error: any) {
+          results.push({ err: error.message });
+        }
       }
 
       res.json({
         success: true,
-        memory_id: result.id,
-        message: 'Emotional state recorded',
+        results,
+        count: results.length,
       });
     } catch (error: any) {
-      console.error('[ai-agents] Error storing emotion:', error);
+      console.error('[ai-agents] Error storing batch:', error);
       res.status(500).json({ err: error.message });
     }
   });
@@ -580,7 +499,7 @@ export function aiagents(app: any) {
       );
 
       if (emotions.length === 0) {
-        return res.json({
+        return sendWithEtag(req, res, {
           success: true,
           trend: 'neutral',
           average_confidence: 0.5,
@@ -603,7 +522,7 @@ export function aiagents(app: any) {
       if (positive > negative * 1.5) trend = 'positive';
       else if (negative > positive * 1.5) trend = 'negative';
 
-      res.json({
+      const body = {
         success: true,
         trend,
         average_confidence: Math.round(avgConfidence * 100) / 100,
@@ -612,6 +531,12 @@ export function aiagents(app: any) {
         neutral_count: emotions.length - positive - negative,
         sample_size: emotions.length,
         recent_emotions: emotions.slice(0, 5),
+      };
+      // Every uncached query rewrites salience, score and last_seen_at, so
+      // tag only the fields that change when the sentiment does
+      sendWithEtag(req, res, body, {
+        ...body,
+        recent_emotions: body.recent_emotions.map((e: any) => [e.id, e.content]),
       });
     } catch (error: any) {
       console.error('[ai-agents] Error analyzing sentiment:', error);
@@ -862,6 +787,7 @@ export function aiagents(app: any) {
 
           detectedPatterns.push({
             pattern_name: patternName,
+            description,
             memory_id: result.id,
             frequency: seq.frequency,
           });
@@ -1528,3 +1454,245 @@ function extractActionType(content: string): string {
   if (match) return match[1].trim();
   return content.substring(0, 50).trim();
 }
+
+// Search a project's memories, restricted to the sectors for memory_type.
+// Returns the response body, or { err } when required fields are missing.
+async function queryMemories(body: any): Promise<any> {
+  const {
+    project_name,
+    query,
+    memory_type = 'all',
+    k = 10,
+    user_id = 'ai-agent-system',
+  } = body;
+
+  if (!project_name || !query) {
+    return { err: 'project_name and query required' };
+  }
+
+  const sectorMap: Record<string, string[]> = {
+    state: ['semantic'],
+    actions: ['episodic'],
+    patterns: ['procedural'],
+    decisions: ['reflective'],
+    all: ['semantic', 'episodic', 'procedural', 'reflective'],
+  };
+
+  const sectors = sectorMap[memory_type] || sectorMap.all;
+  const results = await hsg_query(query, k, {
+    sectors,
+    user_id
+  });
+
+  return {
+    success: true,
+    results,
+    count: results.length,
+  };
+}
+
+// Send a JSON body with an ETag, or an empty 304 when the client already has it.
+// Lets pollers re-check an endpoint without re-downloading an unchanged body.
+// The tag is computed from etagSource when given, so fields that change on
+// every read (salience, last_seen_at) need not defeat it.
+function sendWithEtag(req: any, res: any, body: any, etagSource: any = body): void {
+  const json = JSON.stringify(body);
+  const etag = `"${createHash('sha1').update(etagSource === body ? json : JSON.stringify(etagSource)).digest('hex')}"`;
+  res.setHeader('ETag', etag);
+  if (req.headers['if-none-match'] === etag) {
+    res.status(304).end();
+    return;
+  }
+  res.writeHead(res.statusCode || 200, { 'Content-Type': 'application/json' });
+  res.end(json);
+}
+
+// Store a coding pattern in procedural memory.
+// Returns the response body, or { err } when required fields are missing.
+async function storePattern(body: any): Promise<any> {
+  const {
+    project_name,
+    pattern_name,
+    description,
+    example,
+    tags: userTags = [],
+    user_id = 'ai-agent-system',
+  } = body;
+
+  if (!project_name || !pattern_name || !description) {
+    return { err: 'project_name, pattern_name, and description required' };
+  }
+
+  const content = `Pattern: ${pattern_name}\n${description}${example ? `\n\nExample:\n${example}` : ''}`;
+  const tags = j(['coding-pattern', project_name, ...userTags]);
+  const metadata = {
+    project_name,
+    pattern_name,
+    timestamp: new Date().toISOString(),
+    sector: 'procedural',
+  };
+
+  const result = await add_hsg_memory(content, tags, metadata, user_id);
+
+  return {
+    success: true,
+    memory_id: result.id,
+    message: 'Coding pattern stored',
+  };
+}
+
+// Store an architectural decision in reflective memory.
+// Returns the response body, or { err } when required fields are missing.
+async function recordDecision(body: any): Promise<any> {
+  const {
+    project_name,
+    decision,
+    rationale,
+    alternatives,
+    consequences,
+    user_id = 'ai-agent-system',
+  } = body;
+
+  if (!project_name || !decision || !rationale) {
+    return { err: 'project_name, decision, and rationale required' };
+  }
+
+  const content = `Decision: ${decision}\n\nRationale: ${rationale}${
+    alternatives ? `\n\nAlternatives considered: ${alternatives}` : ''
+  }${consequences ? `\n\nConsequences: ${consequences}` : ''}`;
+  const tags = j(['architectural-decision', project_name]);
+  const metadata = {
+    project_name,
+    decision,
+    timestamp: new Date().toISOString(),
+    sector: 'reflective',
+  };
+
+  const result = await add_hsg_memory(content, tags, metadata, user_id);
+
+  return {
+    success: true,
+    memory_id: result.id,
+    message: 'Architectural decision recorded',
+  };
+}
+
+// Store an agent action in episodic memory and link it to the decision/pattern it used.
+// Returns the response body, or { err } when required fields are missing.
+async function recordAction(body: any): Promise<any> {
+  const {
+    project_name,
+    agent_name,
+    action,
+    context,
+    outcome,
+    related_decision,  // NEW: decision memory ID that led to this action
+    used_pattern,      // NEW: pattern memory ID used in this action
+    user_id = 'ai-agent-system',
+  } = body;
+
+  if (!project_name || !agent_name || !action) {
+    return { err: 'project_name, agent_name, and action required' };
+  }
+
+  const content = `Agent ${agent_name} performed: ${action}\nContext: ${context || 'N/A'}\nOutcome: ${outcome || 'pending'}`;
+  const tags = j(['agent-action', project_name, agent_name]);
+  const metadata = {
+    project_name,
+    agent_name,
+    action,
+    context,
+    outcome,
+    related_decision,
+    used_pattern,
+    timestamp: new Date().toISOString(),
+    sector: 'episodic',
+  };
+
+  const result = await add_hsg_memory(content, tags, metadata, user_id);
+
+  // NEW: Automatically create waypoints for linked memories
+  const links: any = { decision: null, pattern: null };
+  if (related_decision) {
+    await run_async(
+      `INSERT OR REPLACE INTO waypoints (src_id, dst_id, weight, created_at, updated_at)
+       VALUES (?, ?, ?, ?, ?)`,
+      [related_decision, result.id, 0.85, Date.now(), Date.now()]
+    );
+    links.decision = related_decision;
+  }
+  if (used_pattern) {
+    await run_async(
+      `INSERT OR REPLACE INTO waypoints (src_id, dst_id, weight, created_at, updated_at)
+       VALUES (?, ?, ?, ?, ?)`,
+      [used_pattern, result.id, 0.75, Date.now(), Date.now()]
+    );
+    links.pattern = used_pattern;
+  }
+
+  return {
+    success: true,
+    memory_id: result.id,
+    message: 'Agent action recorded' + (related_decision || used_pattern ? ' with links' : ''),
+    links,
+  };
+}
+
+// Store an agent emotional state and link it to the related action.
+// Returns the response body, or { err } when required fields are missing.
+async function recordEmotion(body: any): Promise<any> {
+  const {
+    project_name,
+    agent_name,
+    context,
+    sentiment,      // positive, negative, neutral, frustrated, confident
+    confidence,     // 0.0 - 1.0
+    feeling,        // "This feels right", "Stuck on this", "Very confident"
+    related_action, // Optional: link to action ID
+    user_id = 'ai-agent-system',
+  } = body;
+
+  if (!project_name || !agent_name || !feeling) {
+    return { err: 'project_name, agent_name, and feeling required' };
+  }
+
+  const content = `Agent ${agent_name} feels: ${feeling}\nContext: ${context || 'N/A'}\nSentiment: ${sentiment || 'neutral'}\nConfidence: ${confidence !== undefined ? confidence : 0.5}`;
+  const tags = j(['agent-emotion', project_name, agent_name, sentiment || 'neutral']);
+  const metadata = {
+    project_name,
+    agent_name,
+    sentiment: sentiment || 'neutral',
+    confidence: confidence !== undefined ? confidence : 0.5,
+    related_action,
+    timestamp: new Date().toISOString(),
+    sector: 'emotional',
+  };
+
+  const result = await add_hsg_memory(content, tags, metadata, user_id);
+
+  // Link to related action if provided
+  if (related_action) {
+    await run_async(
+      `INSERT OR REPLACE INTO waypoints (src_id, dst_id, weight, created_at, updated_at)
+       VALUES (?, ?, ?, ?, ?)`,
+      [related_action, result.id, 0.70, Date.now(), Date.now()]
+    );
+  }
+
+  return {
+    success: true,
+    memory_id: result.id,
+    message: 'Emotional state recorded',
+  };
+}
+
+// Queries from one /ai-agents/query-batch request in flight at once
+const QUERY_BATCH_CONCURRENCY = 4;
+
+// Writers available to POST /ai-agents/batch, keyed by item type
+const batchWriters: Record<string, (body: any) => Promise<any>> = {
+  action: recordAction,
+  emotion: recordEmotion,
+  pattern: storePattern,
+  decision: recordDecision,
+};
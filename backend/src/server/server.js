@@ -26,6 +26,7 @@ const path = require('path');
 const http = require('http');
 const WebSocket = require('ws');
 const { parse } = require('url');
+const zlib = require('zlib');
 function server(config = {}) {
     const ROUTES = [];
     const WARES = [];
@@ -160,14 +161,24 @@ function server(config = {}) {
         if (req.headers['content-type']?.includes('application/json')) {
             let d = '';
             let max = config.max_payload_size || 1_000_000;
-            req.on('data', e => {
+            // The size limit applies to the decoded body, not the compressed one
+            let src = req;
+            if (req.headers['content-encoding'] === 'gzip') {
+                src = req.pipe(zlib.createGunzip());
+                src.on('error', () => {
+                    res.status(400).end('Bad Request');
+                    req.destroy();
+                });
+            }
+            src.on('data', e => {
                 d += e;
                 if (d.length > max) {
                     res.status(413).end('Payload Too Large');
+                    src.destroy();
                     req.destroy();
                 }
             });
-            req.on('end', () => {
+            src.on('end', () => {
                 try {
                     req.body = JSON.parse(d);
                 }